@@ -4,7 +4,6 @@ import datetime
 import logging
 from typing import Optional
 
-import requests
 from bs4 import BeautifulSoup
 
 # Ensure service root is on sys.path (mirrors existing scraper layout)
@@ -26,7 +25,7 @@ def _extract_fallback_html(url: str, timeout: int = 25) -> str:
     Prefer <main> or <article> if present; otherwise fall back to <body>.
     '''
     try:
-        resp = requests.get(
+        resp = SU.SESSION.get(
             url,
             timeout=timeout,
             allow_redirects=True,
@@ -44,13 +44,17 @@ _MONTH_DATE_RE = re.compile(
 )
 
 
+_TRAILING_PUBLISHED_RE = re.compile(r"\bPublished\s*$")
+_NEXT_RE = re.compile(r"\bnext\b", re.I)
+
+
 def _abs_url(href: str) -> str:
     return urljoin(BASE_URL, (href or "").strip())
 
 
 def _get(url: str, timeout: int = 30) -> requests.Response:
-    # Use requests directly (CIA pages are typically server-rendered).
-    resp = requests.get(url, headers=HEADERS, timeout=timeout, allow_redirects=True)
+    # Plain HTTP over the shared session (CIA pages are typically server-rendered).
+    resp = SU.SESSION.get(url, headers=HEADERS, timeout=timeout, allow_redirects=True)
     resp.raise_for_status()
     return resp
 
@@ -88,7 +92,7 @@ def _extract_from_listing_anchor(a) -> Optional[Tuple[str, datetime.date]]:
         if d:
             # Heuristic: title is everything before the date match, minus trailing "Published"
             title_part = txt[: m2.start()].strip()
-            title_part = re.sub(r"\bPublished\s*$", "", title_part).strip()
+            title_part = _TRAILING_PUBLISHED_RE.sub("", title_part).strip()
             if title_part:
                 return title_part, d
 
@@ -114,7 +118,7 @@ def _find_next_page_url(soup: BeautifulSoup, current_url: str) -> Optional[str]:
         return urljoin(current_url, a["href"])
 
     # aria-label includes "Next"
-    a = soup.find("a", attrs={"aria-label": re.compile(r"\bnext\b", re.I)})
+    a = soup.find("a", attrs={"aria-label": _NEXT_RE})
     if a and a.get("href"):
         return urljoin(current_url, a["href"])
 
@@ -123,7 +127,7 @@ def _find_next_page_url(soup: BeautifulSoup, current_url: str) -> Optional[str]:
         t = cand.get_text(" ", strip=True)
         if not t:
             continue
-        if re.search(r"\bnext\b", t, re.I) or re.search(r"\bnext page\b", t, re.I):
+        if _NEXT_RE.search(t):  # also covers "Next Page"
             return urljoin(current_url, cand["href"])
 
     return None
@@ -15,7 +15,7 @@ if _service_dir not in sys.path:
     sys.path.insert(0, _service_dir)
 
 from models import ArticleLink, LinkAggregationResult, LinkAggregationStep
-import util.scrape_utils as SU  # noqa: F401  (kept for consistency with other scrapers)
+import util.scrape_utils as SU
 
 LOGGER = logging.getLogger(__name__)
 
@@ -41,7 +41,7 @@ SLASH_DATE_RE = re.compile(r"\b\d{1,2}/\d{1,2}/\d{4}\b")
 # -------------------------
 
 def _get(url: str, timeout: int = 30) -> requests.Response:
-    resp = requests.get(url, headers=UA_HEADERS, timeout=timeout, allow_redirects=True)
+    resp = SU.SESSION.get(url, headers=UA_HEADERS, timeout=timeout, allow_redirects=True)
     resp.raise_for_status()
     return resp
 
@@ -9,7 +9,6 @@ import shutil
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse, parse_qsl, urlencode
 
-import requests
 from bs4 import BeautifulSoup
 
 # Ensure service root is on sys.path (mirrors existing scraper layout)
@@ -154,7 +153,7 @@ def _find_attachments_from_html(html: str, base_url: str) -> List[Tuple[str, str
 
 def _download_bytes(url: str, timeout: int = 40, max_bytes: int = 25 * 1024 * 1024) -> Optional[bytes]:
     try:
-        with requests.get(url, headers=UA_HEADERS, timeout=timeout, allow_redirects=True, stream=True) as r:
+        with SU.SESSION.get(url, headers=UA_HEADERS, timeout=timeout, allow_redirects=True, stream=True) as r:
             r.raise_for_status()
             chunks = []
             total = 0
@@ -6,7 +6,6 @@ import datetime
 import logging
 from typing import Set
 
-import requests
 from bs4 import BeautifulSoup
 
 # Ensure service root is on sys.path (matches existing scraper style)
@@ -30,7 +29,7 @@ def _extract_fallback_html(url: str, timeout: int = 25) -> str:
     Conservative: prefer <main> or <article>, else body.
     """
     try:
-        resp = requests.get(
+        resp = SU.SESSION.get(
             url,
             timeout=timeout,
             allow_redirects=True,
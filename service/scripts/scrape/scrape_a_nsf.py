@@ -5,7 +5,8 @@ import sys
 import re
 import datetime
 import logging
-from urllib.parse import urljoin, urlparse
+from functools import lru_cache
+from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
@@ -29,19 +30,28 @@ LIST_URL_TEMPLATE = (
     "?f%5B0%5D=news_type%3ANSF%20News"
     "&page={{PAGE}}"
 )
+# Listing pages fetched ahead of the one being parsed
+_PREFETCH_PAGES = 3
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; TheFollowUpBot/1.0)",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 }
 
+# Absolute nsf.gov URL whose path is /news/<something>, excluding the
+# /news/releases listing and anything under it. Query/fragment are ignored.
+_ARTICLE_URL_RE = re.compile(
+    r"^.*?://[^/]*nsf\.gov[^/]*/news/(?!releases(?:[/?#]|$))[^?#]*[^/?#]"
+)
+
 # Date like "December 17, 2025" anywhere in text
 _MONTHS = (
     "January|February|March|April|May|June|July|August|September|October|November|December"
 )
-_DATE_RE = re.compile(rf"\b(?:{_MONTHS})\s+\d{{1,2}},\s+\d{{4}}\b")
+_DATE_RE = re.compile(rf"\b({_MONTHS})\s+(\d{{1,2}}),\s+(\d{{4}})\b")
 
 
+@lru_cache(maxsize=4096)
 def _abs_url(href: str) -> str:
     href = (href or "").strip()
     if not href:
@@ -49,18 +59,6 @@ def _abs_url(href: str) -> str:
     return urljoin(BASE, href)
 
 
-def _parse_date_text(txt: str) -> datetime.date | None:
-    txt = (txt or "").strip()
-    if not txt:
-        return None
-    # Normalize whitespace
-    txt = re.sub(r"\s+", " ", txt)
-    try:
-        return datetime.datetime.strptime(txt, "%B %d, %Y").date()
-    except Exception:
-        return None
-
-
 def _date_from_container(node) -> datetime.date | None:
     """
     Try to find a publication date inside an item container.
@@ -82,7 +80,7 @@ def _date_from_container(node) -> datetime.date | None:
                 pass
         # 2) visible time text
         dt_txt = t.get_text(" ", strip=True)
-        dt = _parse_date_text(dt_txt)
+        dt = SU.parse_long_date(dt_txt)
         if dt:
             return dt
 
@@ -90,11 +88,12 @@ def _date_from_container(node) -> datetime.date | None:
     txt = node.get_text(" ", strip=True)
     m = _DATE_RE.search(txt or "")
     if m:
-        return _parse_date_text(m.group(0))
+        return SU.date_from_parts(*m.groups())
 
     return None
 
 
+@lru_cache(maxsize=4096)
 def _is_article_link(href: str) -> bool:
     """
     Heuristic to keep us from pulling nav links.
@@ -105,31 +104,10 @@ def _is_article_link(href: str) -> bool:
     if not href:
         return False
 
-    full = _abs_url(href)
-    try:
-        p = urlparse(full)
-    except Exception:
-        return False
-
-    if p.netloc and "nsf.gov" not in p.netloc:
-        return False
-
-    path = (p.path or "").rstrip("/")
-    if not path.startswith("/news/"):
-        return False
-
-    # Exclusions: not actual release items
-    if path in ("/news", "/news/releases"):
-        return False
-    if path.startswith("/news/releases/"):
-        return False
-
-    # Most release items should be /news/<something>
-    parts = [x for x in path.split("/") if x]
-    return len(parts) >= 2  # e.g., ["news", "<slug>"]
+    return _ARTICLE_URL_RE.match(_abs_url(href)) is not None
 
 
-def _fetch_soup(url: str) -> BeautifulSoup:
+def _fetch(url: str) -> bytes:
     """
     NSF pages often present a JS-required anti-bot interstitial to plain requests.
     Use SU.playwright_get with try_requests='last' so Playwright is attempted first.
@@ -137,59 +115,51 @@ def _fetch_soup(url: str) -> BeautifulSoup:
     """
     resp = SU.playwright_get(url, timeout=30, headers=HEADERS, try_requests="last")
     resp.raise_for_status()
-    return BeautifulSoup(resp.content, "html.parser")
+    return resp.content
 
 
+def _fetch_soup(url: str) -> BeautifulSoup:
+    # lxml's C tree builder is several times faster than html.parser on listing pages.
+    return BeautifulSoup(_fetch(url), "lxml")
+
+
+@lru_cache(maxsize=512)
 def _extract_article(url: str) -> str:
     """
     Fetch an NSF release and return main content HTML.
     Best-effort: <main> or <article> or body.
     """
     try:
-        soup = _fetch_soup(url)
+        content = _fetch(url)
     except Exception:
         return ""
 
-    main = soup.find("main") or soup.find("article") or soup.body or soup
-    if not main:
-        return ""
-
-    # Light cleanup of obvious non-content
-    for tag in main.find_all(["script", "style", "noscript"]):
-        try:
-            tag.decompose()
-        except Exception:
-            pass
-    for sel in ["nav", "header", "footer", "aside", "form"]:
-        for tag in main.find_all(sel):
-            try:
-                tag.decompose()
-            except Exception:
-                pass
-
-    return str(main)
+    # Everything after </main> is footer; don't hand it to the parser.
+    end = content.find(b"</main>")
+    if end != -1:
+        content = content[: end + len(b"</main>")]
+    return SU.main_content_html(content)
 
 
 def _candidate_containers(soup: BeautifulSoup):
     """
-    Try common Drupal/view containers first; fall back to generic.
+    Try the Drupal view rows first; fall back to generic containers.
     """
-    # Drupal-ish listing containers
-    for sel in [
-        "div.view-content article",
-        "div.view-content div.views-row",
-        "div.views-row",
-        "article",
-        "li",
-    ]:
+    # Drupal listing: scope to the view and take its direct rows only
+    content = soup.select_one("div.view-content")
+    if content is not None:
+        nodes = content.select(":scope > div.views-row, :scope > article")
+        if nodes:
+            return nodes
+
+    for sel in ["div.views-row", "article", "li"]:
         nodes = soup.select(sel)
         if nodes:
             return nodes
     return []
 
 
-def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
-    soup = _fetch_soup(url)
+def _parse_page(soup: BeautifulSoup, url: str, scrape_date: datetime.date) -> LinkAggregationStep:
     LOG.info("Scraped NSF listing page: %s", url)
 
     containers = _candidate_containers(soup)
@@ -199,13 +169,14 @@ def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
     seen_links: set[str] = set()
     look_further = True
 
+    # Classify every anchor on the page once; containers just look them up.
+    article_anchors = {
+        id(a) for a in soup.find_all("a", href=True) if _is_article_link(a.get("href", ""))
+    }
+
     for node in containers:
         # Find a plausible article link within this container
-        a = None
-        for candidate in node.find_all("a", href=True):
-            if _is_article_link(candidate.get("href", "")):
-                a = candidate
-                break
+        a = next((c for c in node.find_all("a", href=True) if id(c) in article_anchors), None)
         if not a:
             continue
 
@@ -229,7 +200,7 @@ def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
 
         seen_links.add(link)
         articles.append(
-            ArticleLink(
+            SU.trusted_article_link(
                 title=title,
                 link=link,
                 date=dt,
@@ -248,7 +219,12 @@ def scrape(date: datetime.date) -> LinkAggregationResult:
     Scrape NSF filtered releases list pages until we pass `date`.
     Pages are assumed to be zero-indexed via `page=0,1,2,...`.
     """
-    res = SU.iter_scrape(LIST_URL_TEMPLATE, start_page=0, date=date, scrape_fn=_scrape_page)
+    # Articles can bleed across ?page offsets; memoize per run, not across runs.
+    _extract_article.cache_clear()
+
+    # The next few listing pages are fetched in the background while the
+    # current one is parsed.
+    res = SU.iter_scrape_prefetch(LIST_URL_TEMPLATE, 0, date, _fetch_soup, _parse_page, prefetch=_PREFETCH_PAGES)
 
     # Cross-page dedupe (iter_scrape aggregates blindly)
     uniq: list[ArticleLink] = []
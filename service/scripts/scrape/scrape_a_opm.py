@@ -5,10 +5,11 @@ import sys
 import re
 import datetime
 import logging
+from functools import lru_cache
+from itertools import takewhile
 from typing import Optional
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup, Tag
 
 # Ensure service root is importable (matches existing scraper layout)
@@ -46,7 +47,7 @@ def _get(url: str, timeout: int = 30):
     (Some .gov properties occasionally apply bot heuristics.)
     """
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=timeout, allow_redirects=True)
+        resp = SU.SESSION.get(url, headers=HEADERS, timeout=timeout, allow_redirects=True)
         resp.raise_for_status()
         return resp
     except Exception as e:
@@ -63,15 +64,11 @@ def _fetch_soup(url: str) -> BeautifulSoup:
 
 
 def _parse_date_from_text(text: str) -> Optional[datetime.date]:
-    txt = re.sub(r"\s+", " ", (text or "")).strip()
-    m = _DATE_RE.search(txt)
+    # _DATE_RE already tolerates arbitrary whitespace, so search the text as-is.
+    m = _DATE_RE.search(text or "")
     if not m:
         return None
-    month, day, year = m.group(1), m.group(2), m.group(3)
-    try:
-        return datetime.datetime.strptime(f"{month} {int(day)}, {year}", "%B %d, %Y").date()
-    except Exception:
-        return None
+    return SU.date_from_parts(*m.groups())
 
 
 def _find_latest_news_list(main: Tag) -> Optional[Tag]:
@@ -81,51 +78,43 @@ def _find_latest_news_list(main: Tag) -> Optional[Tag]:
     """
     # Find an h2 whose text is "Latest News"
     latest_h2 = None
-    for h2 in main.find_all(["h2", "h3"]):
+    for h2 in main.select("h2, h3"):
         if h2.get_text(" ", strip=True).lower() == "latest news":
             latest_h2 = h2
             break
     if not latest_h2:
         return None
 
-    # Walk forward to find the first UL/OL container
-    for sib in latest_h2.next_siblings:
-        if isinstance(sib, Tag):
-            if sib.name in ("ul", "ol"):
-                return sib
-            ul = sib.find(["ul", "ol"])
-            if ul:
-                return ul
+    # Walk forward (within this section) to find the first UL/OL container
+    section_siblings = takewhile(
+        lambda sib: sib.name != latest_h2.name,
+        latest_h2.find_next_siblings(limit=10),
+    )
+    for sib in section_siblings:
+        if sib.name in ("ul", "ol"):
+            return sib
+        ul = sib.find(["ul", "ol"])
+        if ul:
+            return ul
     return None
 
 
+@lru_cache(maxsize=512)
 def _extract_article_content(url: str) -> str:
     """
     Best-effort extraction of an OPM news release page body.
     Prefer <main>, then <article>, then <body>.
     """
-    soup = _fetch_soup(url)
-
-    node = soup.find("main") or soup.find("article") or soup.find("body") or soup
-    if not node:
-        return ""
-
-    # Remove obvious boilerplate inside the chosen region
-    for t in node.find_all(["script", "style", "noscript"]):
-        try:
-            t.decompose()
-        except Exception:
-            pass
-
-    # Light cleanup if present
-    for sel in ["nav", "header", "footer", "form"]:
-        for t in node.select(sel):
-            try:
-                t.decompose()
-            except Exception:
-                pass
+    try:
+        # Stop downloading once </main> arrives; the footer is never used.
+        content, _ = SU.get_until(url, b"</main>", headers=HEADERS)
+    except Exception:
+        content = _get(url).content
 
-    return str(node)
+    # <aside> is deliberately left in place for OPM releases.
+    return SU.main_content_html(
+        content, strip_tags=("script", "style", "noscript", "nav", "header", "footer", "form")
+    )
 
 
 def _scrape_listing_for_date(scrape_date: datetime.date) -> LinkAggregationStep:
@@ -190,7 +179,7 @@ def _scrape_listing_for_date(scrape_date: datetime.date) -> LinkAggregationStep:
         seen_links.add(link)
 
         articles.append(
-            ArticleLink(
+            SU.trusted_article_link(
                 title=title,
                 link=link,
                 date=item_date,
@@ -208,6 +197,7 @@ def scrape(date: datetime.date) -> LinkAggregationResult:
     Scrape OPM News Releases and return items published on `date`.
     The listing page does not appear to paginate; we treat it as a single-page feed.
     """
+    _extract_article_content.cache_clear()
     step = _scrape_listing_for_date(date)
     LOG.info("Collected %d OPM news releases for %s", len(step.articles), date.isoformat())
     return LinkAggregationResult.from_steps([step])
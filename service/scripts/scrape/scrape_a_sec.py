@@ -2,14 +2,16 @@ import os
 import sys
 import datetime
 import logging
-from typing import Dict, List, Optional, Tuple
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
 
 # Ensure service root is on sys.path (mirrors existing scraper layout)
 _service_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 if _service_dir not in sys.path:
     sys.path.insert(0, _service_dir)
 
-from models import ArticleLink, LinkAggregationStep, LinkAggregationResult
+from models import LinkAggregationStep, LinkAggregationResult
 import util.scrape_utils as SU
 
 LOGGER = logging.getLogger(__name__)
@@ -35,35 +37,26 @@ def _to_date(dt: Optional[datetime.datetime]) -> Optional[datetime.date]:
 
 
 def _merge_tags(existing: List[str], new_tags: List[str]) -> List[str]:
-    # Dedupe while preserving order
-    out: List[str] = []
-    seen = set()
-    for t in (existing or []) + (new_tags or []):
-        t = (t or "").strip()
-        if not t or t in seen:
-            continue
-        seen.add(t)
-        out.append(t)
-    return out
-
-
-def _add_or_merge(by_link: Dict[str, ArticleLink], article: ArticleLink) -> None:
+    # Dedupe while preserving order (dict keys keep insertion order)
+    stripped = (t.strip() for t in chain(existing or (), new_tags or ()) if t)
+    return list(dict.fromkeys(t for t in stripped if t))
+
+
+def _add_or_merge(by_link: Dict[str, Dict[str, Any]], item: Dict[str, Any]) -> None:
     """
     Deduplicate by link; if a duplicate appears across feeds, merge tags and keep
     the more informative raw_content when possible.
-    """
-    if article.link in by_link:
-        existing = by_link[article.link]
-        merged_tags = _merge_tags(existing.tags, article.tags)
 
-        raw = existing.raw_content or ""
-        incoming_raw = article.raw_content or ""
-        if len(incoming_raw) > len(raw):
-            raw = incoming_raw
+    Works on plain dicts so the ArticleLink is only built once per link.
+    """
+    existing = by_link.get(item["link"])
+    if existing is None:
+        by_link[item["link"]] = item
+        return
 
-        by_link[article.link] = existing.model_copy(update={"tags": merged_tags, "raw_content": raw})
-    else:
-        by_link[article.link] = article
+    existing["tags"] = _merge_tags(existing["tags"], item["tags"])
+    if len(item["raw_content"] or "") > len(existing["raw_content"] or ""):
+        existing["raw_content"] = item["raw_content"]
 
 
 def scrape(date: datetime.date) -> LinkAggregationResult:
@@ -77,47 +70,46 @@ def scrape(date: datetime.date) -> LinkAggregationResult:
     """
     LOGGER.info("Scraping SEC RSS feeds for date=%s", date.isoformat())
 
-    by_link: Dict[str, ArticleLink] = {}
+    by_link: Dict[str, Dict[str, Any]] = {}
 
     for feed_url, feed_kind in FEEDS:
+        LOGGER.info("SEC RSS: reading %s", feed_url)
         try:
-            items = SU.read_rss_feed(feed_url)
+            # Streamed, so the newest-first break below also stops the download.
+            for it in SU.iter_rss_feed(feed_url):
+                title = (it.get("title") or "").strip()
+                href = (it.get("link") or "").strip()
+                pub_dt = it.get("published")
+                summary = (it.get("summary") or "").strip()
+
+                if not title or not href:
+                    continue
+                # Feed links are usually absolute already; resolve any that aren't.
+                link = urljoin(feed_url, href)
+
+                item_date = _to_date(pub_dt)
+                if not item_date:
+                    # SEC feeds should include pubDate, but if missing, skip rather than guessing.
+                    continue
+
+                if item_date < date:
+                    # Feeds are newest-first; nothing further down can match.
+                    break
+                if item_date != date:
+                    continue
+
+                _add_or_merge(by_link, {
+                    "title": title,
+                    "link": link,
+                    "date": item_date,
+                    "tags": [SEC_TAG, feed_kind],
+                    "raw_content": summary,
+                    "process_posturing": True,
+                })
         except Exception as e:
             LOGGER.exception("Failed to read SEC RSS feed %s: %s", feed_url, e)
-            continue
-
-        LOGGER.info("SEC RSS: %s -> %d items", feed_url, len(items))
-
-        for it in items:
-            title = (it.get("title") or "").strip()
-            link = (it.get("link") or "").strip()
-            pub_dt = it.get("published")
-            summary = (it.get("summary") or "").strip()
-
-            if not title or not link:
-                continue
-
-            item_date = _to_date(pub_dt)
-            if not item_date:
-                # SEC feeds should include pubDate, but if missing, skip rather than guessing.
-                continue
-
-            if item_date != date:
-                continue
-
-            tags = [SEC_TAG, feed_kind]
-
-            art = ArticleLink(
-                title=title,
-                link=link,
-                date=item_date,
-                tags=tags,
-                raw_content=summary,
-                process_posturing=True,
-            )
-            _add_or_merge(by_link, art)
 
-    articles = list(by_link.values())
+    articles = [SU.trusted_article_link(**d) for d in by_link.values()]
     # Deterministic ordering: newest first, then title.
     articles.sort(key=lambda a: (a.date, a.title), reverse=True)
 
@@ -4,14 +4,15 @@ import os
 import sys
 import datetime
 import logging
-from typing import Dict
+from typing import Any, Dict
+from urllib.parse import urljoin
 
 # Ensure service root is on path (matches existing scraper pattern)
 _service_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 if _service_dir not in sys.path:
     sys.path.insert(0, _service_dir)
 
-from models import ArticleLink, LinkAggregationStep, LinkAggregationResult
+from models import LinkAggregationStep, LinkAggregationResult
 import util.scrape_utils as SU
 
 
@@ -22,16 +23,15 @@ FEEDS = [
 ]
 
 
-def _add_or_merge(by_link: Dict[str, ArticleLink], article: ArticleLink) -> None:
+def _add_or_merge(by_link: Dict[str, Dict[str, Any]], item: Dict[str, Any]) -> None:
     """
     Deduplicate by link; if a duplicate appears, merge tags.
     """
-    if article.link in by_link:
-        existing = by_link[article.link]
-        merged = list(dict.fromkeys(existing.tags + article.tags))
-        by_link[article.link] = existing.model_copy(update={"tags": merged})
+    existing = by_link.get(item["link"])
+    if existing is None:
+        by_link[item["link"]] = item
     else:
-        by_link[article.link] = article
+        existing["tags"] = list(dict.fromkeys(existing["tags"] + item["tags"]))
 
 
 def scrape(date: datetime.date) -> LinkAggregationResult:
@@ -40,39 +40,43 @@ def scrape(date: datetime.date) -> LinkAggregationResult:
     Raw content is taken from the RSS item's summary/encoded content.
     """
     logger = logging.getLogger(__name__)
-    by_link: Dict[str, ArticleLink] = {}
+    by_link: Dict[str, Dict[str, Any]] = {}
 
     for feed_url, tag in FEEDS:
-        items = SU.read_rss_feed(feed_url)
-        logger.info(f"VA RSS: {feed_url} -> {len(items)} items")
-
-        for it in items:
+        logger.info(f"VA RSS: reading {feed_url}")
+        # Streamed, so the newest-first break below also stops the download.
+        for it in SU.iter_rss_feed(feed_url):
             pub = it.get("published")
             if not pub:
                 continue
 
             pub_date = pub.date()
+            if pub_date < date:
+                # Feeds are newest-first; nothing further down can match.
+                break
             if pub_date != date:
                 continue
 
             title = (it.get("title") or "").strip()
-            link = (it.get("link") or "").strip()
+            href = (it.get("link") or "").strip()
             summary = (it.get("summary") or "").strip()
 
-            if not title or not link:
+            if not title or not href:
                 continue
-
-            art = ArticleLink(
-                title=title,
-                link=link,
-                date=pub_date,
-                tags=["Department of Veterans Affairs", tag],
-                raw_content=summary,
-                process_posturing=True,
-            )
-            _add_or_merge(by_link, art)
-
-    step = LinkAggregationStep(articles=list(by_link.values()), look_further=False)
+            # Feed links are usually absolute already; resolve any that aren't.
+            link = urljoin(feed_url, href)
+
+            _add_or_merge(by_link, {
+                "title": title,
+                "link": link,
+                "date": pub_date,
+                "tags": ["Department of Veterans Affairs", tag],
+                "raw_content": summary,
+                "process_posturing": True,
+            })
+
+    articles = [SU.trusted_article_link(**d) for d in by_link.values()]
+    step = LinkAggregationStep(articles=articles, look_further=False)
     logger.info(f"VA RSS: returning {len(step.articles)} deduped articles for {date.isoformat()}")
 
     return LinkAggregationResult.from_steps([step])
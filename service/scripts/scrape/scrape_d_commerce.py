@@ -2,9 +2,10 @@ import os
 import sys
 import datetime
 import logging
+from functools import lru_cache
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 # Match your existing repo structure (same idea as scrape_wh.py)
 _service_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -34,10 +35,19 @@ def _safe_get(url: str):
     return SU.playwright_get(url, timeout=15, headers=_DEFAULT_HEADERS)
 
 
+@lru_cache(maxsize=512)
 def _extract(article_url: str) -> str:
     """Fetch and return the main content HTML of an article page."""
-    resp = _safe_get(article_url)
-    soup = BeautifulSoup(resp.content, "html.parser")
+    try:
+        # <main> closes mid-document on commerce.gov; skip the rest of the body.
+        content, has_main = SU.get_until(article_url, b"</main>", timeout=15, headers=_DEFAULT_HEADERS)
+    except Exception:
+        content, has_main = _safe_get(article_url).content, False
+
+    if has_main:
+        soup = BeautifulSoup(content, "html.parser", parse_only=SoupStrainer("main"))
+    else:
+        soup = BeautifulSoup(content, "html.parser")
     LOG.info(f"Scraped Content Page {article_url}")
 
     main = soup.find("main")
@@ -58,19 +68,13 @@ def _parse_list_date(article: BeautifulSoup) -> datetime.date | None:
     time_tag = article.select_one("div.field--name-field-release-datetime time.datetime")
     if time_tag and time_tag.get_text(strip=True):
         txt = time_tag.get_text(strip=True)
-        try:
-            return datetime.datetime.strptime(txt, "%B %d, %Y").date()
-        except ValueError:
-            return None
+        return SU.parse_long_date(txt)
 
     # Fallback: any time.datetime with actual text (some templates may differ)
     time_tag = article.select_one("time.datetime")
     if time_tag and time_tag.get_text(strip=True):
         txt = time_tag.get_text(strip=True)
-        try:
-            return datetime.datetime.strptime(txt, "%B %d, %Y").date()
-        except ValueError:
-            return None
+        return SU.parse_long_date(txt)
 
     return None
 
@@ -83,7 +87,8 @@ def _scrape_page(url: str, min_date: datetime.date) -> LinkAggregationStep:
     max_date = min_date + datetime.timedelta(days=1)
 
     resp = _safe_get(url)
-    soup = BeautifulSoup(resp.content, "html.parser")
+    # Listing pages are only CSS-queried; lxml's C tree builder is much faster than html.parser.
+    soup = BeautifulSoup(resp.content, "lxml")
     LOG.info(f"Scraped {url}")
 
     articles_out: list[ArticleLink] = []
@@ -103,27 +108,21 @@ def _scrape_page(url: str, min_date: datetime.date) -> LinkAggregationStep:
 
         title = a.get_text(strip=True)
         href = a.get("href", "").strip()
+        if not title or not href:
+            continue
         link = urljoin(BASE, href)
 
         news_type_el = node.select_one("div.field--name-field-news-type")
         news_type = news_type_el.get_text(strip=True) if news_type_el else "News"
 
         # Optional: collect issues/tags shown on the card (Press Releases usually have these)
-        tag_texts: list[str] = []
-        tag_texts.append(news_type)
-
-        for t in node.select("div.field--name-field-issues a, div.field--name-field-tags a"):
-            txt = t.get_text(strip=True)
-            if txt:
-                tag_texts.append(txt)
+        tag_texts = [
+            t.get_text(strip=True)
+            for t in node.select("div.field--name-field-issues a, div.field--name-field-tags a")
+        ]
 
         # De-dupe while preserving order
-        seen = set()
-        tags = ["Department of Commerce"]
-        for t in tag_texts:
-            if t not in seen:
-                seen.add(t)
-                tags.append(t)
+        tags = list(dict.fromkeys(["Department of Commerce", news_type, *filter(None, tag_texts)]))
 
         date_val = _parse_list_date(node)
         # If listing omits the date (some Blog/tweets cards), assume it's within the filtered range.
@@ -139,7 +138,7 @@ def _scrape_page(url: str, min_date: datetime.date) -> LinkAggregationStep:
         # Keep only articles within [min_date, max_date]
         if min_date <= date_val <= max_date:
             articles_out.append(
-                ArticleLink(
+                SU.trusted_article_link(
                     title=title,
                     link=link,
                     date=date_val,
@@ -157,6 +156,7 @@ def scrape(date: datetime.date) -> LinkAggregationResult:
     date: expected to be the previous day (min).
     We automatically set max = date + 1 day (present day).
     """
+    _extract.cache_clear()
     min_str = date.isoformat()
     max_str = (date + datetime.timedelta(days=1)).isoformat()
 
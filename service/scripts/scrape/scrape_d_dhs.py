@@ -2,12 +2,13 @@
 
 import os
 import sys
+import re
 import datetime
 import logging
-from urllib.parse import urljoin
+from functools import lru_cache
 
-import requests
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import SoupStrainer
 
 _service_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 if _service_dir not in sys.path:
@@ -18,17 +19,14 @@ import util.scrape_utils as SU
 
 BASE_URL = "https://www.dhs.gov"
 
-log = logging.getLogger(__name__)
-
+# Listing selectors
+_ROW_SEL = sv.compile("div.news-updates.views-row")
+_TITLE_SEL = sv.compile("h3.news-updates-title a")
+_TYPE_SEL = sv.compile(".news-updates-date-type span.news-type a")
+# Only the listing rows are needed from the page; skip building the rest of the tree
+_ROW_STRAINER = SoupStrainer("div", class_=re.compile(r"(^|\s)views-row(\s|$)"))
 
-def _get(url: str, timeout: int = 30) -> requests.Response:
-    headers = {
-        "User-Agent": "Mozilla/5.0 (compatible; TheFollowUpBot/1.0)",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    }
-    resp = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-    resp.raise_for_status()
-    return resp
+log = logging.getLogger(__name__)
 
 
 def _parse_item_date(row) -> datetime.date | None:
@@ -40,51 +38,35 @@ def _parse_item_date(row) -> datetime.date | None:
     if time_tag:
         dt_attr = time_tag.get("datetime")
         if dt_attr:
+            # The attribute is always ISO-8601 with a local offset; its first
+            # ten characters are the local calendar date.
             try:
-                return datetime.datetime.fromisoformat(dt_attr).date()
-            except Exception:
-                pass
-        txt = time_tag.get_text(strip=True)
-        for fmt in ("%B %d, %Y", "%b %d, %Y"):
-            try:
-                return datetime.datetime.strptime(txt, fmt).date()
-            except Exception:
-                continue
+                return datetime.date.fromisoformat(dt_attr[:10])
+            except ValueError:
+                log.warning(f"Unrecognized DHS time@datetime {dt_attr!r}")
+                return None
+        return SU.parse_long_date(time_tag.get_text(strip=True))
     return None
 
 
+@lru_cache(maxsize=512)
 def _extract(url: str) -> str:
     """
     Best-effort content extraction for DHS nodes.
     We return the main/article region HTML with noisy tags stripped.
     """
-    resp = _get(url)
-    soup = BeautifulSoup(resp.content, "html.parser")
-
-    main = (
-        soup.find("main")
-        or soup.find(id="main-content")
-        or soup.find("article")
-        or soup.find("div", attrs={"role": "main"})
+    return SU.extract_main(
+        url,
+        roots=(".//main", ".//*[@id='main-content']", ".//article", ".//div[@role='main']"),
+        strip_tags=("script", "style", "noscript", "header", "footer", "nav", "form"),
     )
-    if not main:
-        main = soup.body or soup
-
-    # Remove obvious noise inside the extracted region
-    for tag in main.find_all(["script", "style", "noscript"]):
-        tag.decompose()
-    for tag in main.find_all(["header", "footer", "nav", "form"]):
-        tag.decompose()
-
-    return str(main)
 
 
 def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
-    resp = _get(url)
-    soup = BeautifulSoup(resp.content, "html.parser")
+    soup = SU.fetch_soup(url, strainer=_ROW_STRAINER)
     log.info(f"Scraped {url}")
 
-    rows = soup.select("div.news-updates.views-row")
+    rows = _ROW_SEL.select(soup)
     log.info(f"Found {len(rows)} rows on {url}")
 
     articles: list[ArticleLink] = []
@@ -104,14 +86,14 @@ def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
             look_further = False
             break
 
-        a = row.select_one("h3.news-updates-title a")
+        a = _TITLE_SEL.select_one(row)
         if not a or not a.get("href"):
             continue
 
         title = a.get_text(strip=True)
-        link = urljoin(BASE_URL, a["href"])
+        link = SU.fast_urljoin(BASE_URL, a["href"])
 
-        type_a = row.select_one(".news-updates-date-type span.news-type a")
+        type_a = _TYPE_SEL.select_one(row)
         news_type = [type_a.get_text(strip=True)] if type_a else []
 
         articles.append(
@@ -121,15 +103,19 @@ def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
                 date=date,
                 tags=["Department of Homeland Security"] + news_type,
                 process_posturing=True,
-                raw_content=_extract(link),
+                raw_content="",
             )
         )
 
+    SU.fill_raw_content(articles, _extract)
+
     log.info(f"Processed {len(articles)} articles from {url}. Look Further: {look_further}")
     return LinkAggregationStep(articles=articles, look_further=look_further)
 
 
 def scrape(date: datetime.date) -> LinkAggregationResult:
+    _extract.cache_clear()
+
     # Pages are zero-indexed.
     url_template = (
         "https://www.dhs.gov/all-news-updates"
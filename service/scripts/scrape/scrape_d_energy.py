@@ -3,9 +3,10 @@ import sys
 import re
 import datetime
 import logging
+from functools import lru_cache
 from typing import List, Optional
 
-import requests
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 # Match existing scraper layout: this file typically lives under a scraper subdir.
@@ -18,78 +19,39 @@ import util.scrape_utils as SU
 
 
 DOE_BASE = "https://www.energy.gov"
+log = logging.getLogger(__name__)
 
 
 def _abs_url(href: str) -> str:
-    if not href:
-        return ""
-    if href.startswith("http://") or href.startswith("https://"):
-        return href
-    if href.startswith("//"):
-        return "https:" + href
-    if href.startswith("/"):
-        return DOE_BASE + href
-    return DOE_BASE.rstrip("/") + "/" + href
+    return SU.fast_urljoin(DOE_BASE, href) if href else ""
 
 
-_DATE_RE = re.compile(r"^[A-Z][a-z]+\s+\d{1,2},\s+\d{4}$")
+_DATE_RE = re.compile(r"\b([A-Z][a-z]+)\s+(\d{1,2}),\s+(\d{4})\b")
+_MUI_LIST_RE = re.compile(r"MuiList-root")
+_MUI_LIST_ITEM_RE = re.compile(r"MuiListItem-root")
 
-
-def _parse_date(txt: str) -> Optional[datetime.date]:
-    txt = (txt or "").strip()
-    if not txt:
-        return None
-    try:
-        return datetime.datetime.strptime(txt, "%B %d, %Y").date()
-    except Exception:
-        return None
+# Result-item selectors
+_USA_TAG_SEL = sv.compile("span.usa-tag")
+_CHIP_SEL = sv.compile("span.MuiChip-label")
 
 
+@lru_cache(maxsize=512)
 def _extract(url: str) -> str:
     """Fetch and return a best-effort HTML snippet for the article content."""
-    hdrs = {"User-Agent": "Mozilla/5.0 (compatible; TheFollowUpBot/1.0)"}
-    resp = requests.get(url, headers=hdrs, timeout=25, allow_redirects=True)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.content, "html.parser")
-
-    # Prefer <main>, fallback to first <article>, else body.
-    root = soup.find("main") or soup.find("article") or soup.body
-    if not root:
-        return ""
-
-    # Remove obvious boilerplate.
-    for tag in root.find_all(["script", "style", "noscript"]):
-        tag.decompose()
-    for sel in ["header", "footer", "nav", "form", "aside"]:
-        for tag in root.find_all(sel):
-            tag.decompose()
-
-    return str(root)
+    # Prefer <main>, fallback to first <article>, else body; strip obvious boilerplate.
+    return SU.extract_main(url, timeout=25)
 
 
 def _extract_tags(li: BeautifulSoup) -> List[str]:
-    tags: List[str] = []
-
-    # Primary type tags
-    for t in li.select("span.usa-tag"):
-        val = t.get_text(strip=True)
-        if val:
-            tags.append(val)
-
-    # Secondary chips (site / office labels)
-    for t in li.select("span.MuiChip-label"):
-        val = t.get_text(strip=True)
-        if val:
-            tags.append(val)
-
-    # Dedupe while preserving order
-    seen = set()
-    out = []
-    for t in tags:
-        if t not in seen:
-            seen.add(t)
-            out.append(t)
-    return out
+    # Primary type tags, then secondary chips (site / office labels);
+    # an order-preserving dict dedupes in the same pass.
+    out = {}
+    for sel in (_USA_TAG_SEL, _CHIP_SEL):
+        for t in sel.select(li):
+            val = t.get_text(strip=True)
+            if val:
+                out[val] = None
+    return list(out)
 
 
 def _find_result_items(soup: BeautifulSoup):
@@ -99,29 +61,38 @@ def _find_result_items(soup: BeautifulSoup):
     the result list as <ul class="MuiList-root ..."> with <li class="MuiListItem-root ...">.
     """
     # Prefer the obvious list container.
-    ul = soup.find("ul", class_=re.compile(r"MuiList-root"))
+    ul = soup.find("ul", class_=_MUI_LIST_RE)
     if ul:
-        return ul.find_all("li", class_=re.compile(r"MuiListItem-root"))
+        return ul.find_all("li", class_=_MUI_LIST_ITEM_RE)
 
     # Fallback: scan for list items that contain a usa-tag and a link.
     candidates = []
     for li in soup.find_all("li"):
-        if li.select_one("span.usa-tag") and li.find("a", href=True):
+        if _USA_TAG_SEL.select_one(li) and li.find("a", href=True):
             candidates.append(li)
     return candidates
 
 
+def _item_date(li, a) -> Optional[datetime.date]:
+    """Find a date like "December 10, 2025" in the list item's text.
+
+    One get_text() per item and a regex search, rather than walking every
+    span/p descendant. The link text is dropped first so a date quoted in
+    the title can't be mistaken for the publication date.
+    """
+    text = li.get_text(" ", strip=True).replace(a.get_text(" ", strip=True), " ", 1)
+    for m in _DATE_RE.finditer(text):
+        d = SU.date_from_parts(*m.groups())
+        if d:
+            return d
+    return None
+
+
 def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
-    hdrs = {
-        "User-Agent": "Mozilla/5.0 (compatible; TheFollowUpBot/1.0)",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    }
-    resp = requests.get(url, headers=hdrs, timeout=25, allow_redirects=True)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.content, "html.parser")
+    soup = SU.fetch_soup(url, timeout=25)
 
     items = _find_result_items(soup)
-    logging.getLogger(__name__).info(f"Scraped {url} - found {len(items)} result items")
+    log.info(f"Scraped {url} - found {len(items)} result items")
 
     articles: List[ArticleLink] = []
     seen_links = set()
@@ -141,14 +112,7 @@ def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
         if not title or not link:
             continue
 
-        # Find a date string like "December 10, 2025" inside the list item.
-        date_str = None
-        for node in li.find_all(["span", "p"], string=True):
-            txt = (node.get_text(strip=True) or "").strip()
-            if _DATE_RE.match(txt):
-                date_str = txt
-                break
-        item_date = _parse_date(date_str or "")
+        item_date = _item_date(li, a)
         if not item_date:
             # If DOE changes markup, we still want the link, but date is required by our model.
             # Skip rather than guessing.
@@ -165,7 +129,6 @@ def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
         seen_links.add(link)
 
         tags = _extract_tags(li)
-        raw_content = _extract(link)
 
         articles.append(
             ArticleLink(
@@ -173,11 +136,13 @@ def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
                 link=link,
                 date=item_date,
                 tags=tags + ['Department of Energy'],
-                raw_content=raw_content,
+                raw_content="",
                 process_posturing=True,
             )
         )
 
+    SU.fill_raw_content(articles, _extract)
+
     return LinkAggregationStep(articles=articles, look_further=look_further)
 
 
@@ -186,6 +151,7 @@ def scrape(date: datetime.date) -> LinkAggregationResult:
 
     NOTE: The URL below mirrors the filtered search page and only varies `page=`.
     """
+    _extract.cache_clear()
 
     url_template = (
         "https://www.energy.gov/search?page={{PAGE}}&sort_by=date"
@@ -198,15 +164,11 @@ def scrape(date: datetime.date) -> LinkAggregationResult:
 
     res = SU.iter_scrape(url_template, 0, date, _scrape_page)
 
-    # Cross-page dedupe (iter_scrape aggregates blindly).
-    uniq = []
-    seen = set()
+    # Cross-page dedupe (iter_scrape aggregates blindly); the first copy of a link wins.
+    by_link = {}
     for a in res.articles:
-        if a.link in seen:
-            continue
-        seen.add(a.link)
-        uniq.append(a)
-    res.articles = uniq
+        by_link.setdefault(a.link, a)
+    res.articles = list(by_link.values())
     return res
 
 
@@ -4,9 +4,6 @@ import datetime
 import logging
 from typing import Optional
 
-import requests
-from bs4 import BeautifulSoup
-
 # Ensure service root is on sys.path (mirrors existing scraper layout)
 _service_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 if _service_dir not in sys.path:
@@ -17,6 +14,7 @@ import util.scrape_utils as SU
 
 
 _FEED_URL = "https://www.hhs.gov/rss/news.xml"
+log = logging.getLogger(__name__)
 
 
 def _extract_fallback_html(url: str, timeout: int = 20) -> str:
@@ -25,19 +23,7 @@ def _extract_fallback_html(url: str, timeout: int = 20) -> str:
     We keep it conservative: grab <main> or <article> if present, else body.
     """
     try:
-        resp = requests.get(
-            url,
-            timeout=timeout,
-            allow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (compatible; TheFollowUpBot/1.0)",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            },
-        )
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.content, "html.parser")
-        container = soup.find("main") or soup.find("article") or soup.body
-        return str(container) if container else ""
+        return SU.extract_main(url, timeout=timeout, strip_tags=())
     except Exception:
         return ""
 
@@ -60,7 +46,7 @@ def scrape(date: datetime.date) -> LinkAggregationResult:
 
     Note: RSS feeds typically only include recent items; there is no pagination.
     """
-    logging.getLogger(__name__).info(f"Reading RSS feed: {_FEED_URL}")
+    log.info(f"Reading RSS feed: {_FEED_URL}")
     items = SU.read_rss_feed(_FEED_URL)
 
     seen = set()
@@ -84,23 +70,24 @@ def scrape(date: datetime.date) -> LinkAggregationResult:
         if pub_date and pub_date != date:
             continue
 
-        raw = (it.get("summary") or "").strip()
-        if not raw:
-            raw = _extract_fallback_html(link)
-
         articles.append(
             ArticleLink(
                 title=title,
                 link=link,
                 date=pub_date or date,
                 tags=["Department of Health and Human Services"],
-                raw_content=raw,
+                raw_content=(it.get("summary") or "").strip(),
                 process_posturing=True,
             )
         )
 
+    # Only items the feed left without a summary need a page fetch; do those
+    # once every cheap filter has run, and concurrently.
+    missing = [a for a in articles if not a.raw_content]
+    SU.fill_raw_content(missing, _extract_fallback_html)
+
     step = LinkAggregationStep(articles=articles, look_further=False)
-    logging.getLogger(__name__).info(f"Collected {len(articles)} HHS RSS items for {date.isoformat()}")
+    log.info(f"Collected {len(articles)} HHS RSS items for {date.isoformat()}")
     return LinkAggregationResult.from_steps([step])
 
 
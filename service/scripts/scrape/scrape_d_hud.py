@@ -2,11 +2,10 @@ import os
 import sys
 import datetime
 import logging
+from functools import lru_cache
 from typing import Optional, Tuple
 
-import requests
-from bs4 import BeautifulSoup, Tag
-from bs4.element import NavigableString
+from lxml import etree
 
 # Ensure service root is on path (matches existing scraper pattern)
 _service_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -14,71 +13,52 @@ if _service_dir not in sys.path:
     sys.path.insert(0, _service_dir)
 
 from models import ArticleLink, LinkAggregationStep, LinkAggregationResult  # noqa: E402
+import util.scrape_utils as SU  # noqa: E402
 
 
 BASE_URL = "https://www.hud.gov"
 NEWS_URL = f"{BASE_URL}/news"  # anchor #PR doesn't change server response
 
+log = logging.getLogger(__name__)
+
+
+def _class_xpath(axis: str, cls: str) -> str:
+    return f"{axis}::div[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')][1]"
 
-def _abs_url(href: str) -> str:
-    if not href:
-        return ""
-    if href.startswith("http://") or href.startswith("https://"):
-        return href
-    if href.startswith("/"):
-        return f"{BASE_URL}{href}"
-    return f"{BASE_URL}/{href}"
 
+_NEWSBOX_AFTER_XPATH = _class_xpath("following", "newsbox")
+_COLLAPSE_XPATH = _class_xpath("descendant", "collapse")
 
-def _fetch_soup(url: str, timeout: int = 30) -> BeautifulSoup:
-    headers = {
-        "User-Agent": "Mozilla/5.0 (compatible; TheFollowUpBot/1.0)",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    }
-    resp = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-    resp.raise_for_status()
-    return BeautifulSoup(resp.content, "html.parser")
+
+def _abs_url(href: str) -> str:
+    return SU.fast_urljoin(BASE_URL, href) if href else ""
 
 
+@lru_cache(maxsize=512)
 def _extract_article(url: str) -> str:
     """
     Fetch an individual HUD press release page and return a best-effort "main content" HTML.
     We intentionally keep this resilient (HUD templates can vary across years).
     """
-    soup = _fetch_soup(url)
-
-    # Prefer <main>, otherwise fall back to <article>, then body.
-    main = soup.find("main")
-    if main:
-        # Many HUD pages have a single main container; return it as-is.
-        return str(main)
+    # Prefer <main>, otherwise fall back to <article>, then body; returned as-is.
+    return SU.extract_main(url, strip_tags=())
 
-    art = soup.find("article")
-    if art:
-        return str(art)
 
-    body = soup.find("body")
-    return str(body) if body else str(soup)
-
-
-def _parse_press_release_paragraph(p: Tag) -> Optional[Tuple[datetime.date, str, str]]:
+def _parse_press_release_paragraph(p: etree._Element) -> Optional[Tuple[datetime.date, str, str]]:
     """
     A press release entry looks like:
       <p>Thursday, December 11, 2025<br><a href="/news/hud-no-25-147">Title</a> - Optional Suffix</p>
     Returns (date, title, url) or None if the paragraph isn't a PR entry.
     """
-    if not p or p.name != "p":
-        return None
-
-    a = p.find("a", href=True)
-    if not a:
+    if p is None or p.tag != "p":
         return None
 
-    # Date is the first text node before <br/>
-    if not p.contents or not isinstance(p.contents[0], NavigableString):
+    a = p.find(".//a[@href]")
+    if a is None:
         return None
 
-    date_raw = str(p.contents[0]).strip()
+    # Date is the leading text node before <br/>
+    date_raw = (p.text or "").strip()
     # Guard against footer links like "More Press Releases"
     if not date_raw or "," not in date_raw:
         return None
@@ -88,26 +68,21 @@ def _parse_press_release_paragraph(p: Tag) -> Optional[Tuple[datetime.date, str,
     except Exception:
         return None
 
-    title = a.get_text(strip=True)
+    title = a.text_content().strip()
 
     # Some entries include a trailing region suffix like " - Maryland" after the link.
-    # Capture any trailing text nodes after the <a>.
-    suffix_parts = []
-    for node in a.next_siblings:
-        if isinstance(node, NavigableString):
-            s = str(node).strip()
-            if s:
-                suffix_parts.append(s)
-        elif isinstance(node, Tag):
-            # Rare, but if there's an <em> or similar outside the <a>
-            s = node.get_text(" ", strip=True)
-            if s:
-                suffix_parts.append(s)
+    # Capture any trailing text after the <a>: its tail, plus any sibling
+    # elements (rare, e.g. an <em> outside the <a>) and their tails.
+    suffix_parts = [(a.tail or "").strip()]
+    for node in a.itersiblings():
+        suffix_parts.append(" ".join(node.text_content().split()))
+        suffix_parts.append((node.tail or "").strip())
+    suffix_parts = [s for s in suffix_parts if s]
 
     if suffix_parts:
         title = f"{title} {' '.join(suffix_parts)}".strip()
 
-    url = _abs_url(a["href"])
+    url = _abs_url(a.get("href"))
     if not url:
         return None
 
@@ -115,26 +90,28 @@ def _parse_press_release_paragraph(p: Tag) -> Optional[Tuple[datetime.date, str,
 
 
 def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
-    soup = _fetch_soup(url)
-    logging.getLogger(__name__).info(f"Scraped {url}")
+    root = SU.parse_html(SU.fetch(url))
+    log.info(f"Scraped {url}")
 
     # The PR section is anchored by <h2 id="PR">Press Releases</h2>
-    pr_h2 = soup.find("h2", id="PR")
-    if not pr_h2:
-        logging.getLogger(__name__).warning("Could not find PR section (h2#PR).")
+    pr_h2 = root.find(".//h2[@id='PR']")
+    if pr_h2 is None:
+        log.warning("Could not find PR section (h2#PR).")
         return LinkAggregationStep(articles=[], look_further=False)
 
     # Entries live under the first .newsbox .collapse after the PR header.
-    newsbox = pr_h2.find_next("div", class_="newsbox")
-    collapse = newsbox.find("div", class_="collapse") if newsbox else None
-    if not collapse:
-        logging.getLogger(__name__).warning("Could not find PR collapse container under PR section.")
+    newsbox = next(iter(pr_h2.xpath(_NEWSBOX_AFTER_XPATH)), None)
+    collapse = next(iter(newsbox.xpath(_COLLAPSE_XPATH)), None) if newsbox is not None else None
+    if collapse is None:
+        log.warning("Could not find PR collapse container under PR section.")
         return LinkAggregationStep(articles=[], look_further=False)
 
     articles = []
 
     # Paragraphs are in reverse chronological order across months/years.
-    for p in collapse.find_all("p"):
+    # iter() walks lazily, so the break below stops before touching the
+    # (years-long) tail of older entries.
+    for p in collapse.iter("p"):
         parsed = _parse_press_release_paragraph(p)
         if not parsed:
             continue
@@ -154,15 +131,19 @@ def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
                 date=dt,
                 tags=["Department of Housing and Urban Development"],
                 process_posturing=True,
-                raw_content=_extract_article(link),
+                raw_content="",
             )
         )
 
+    SU.fill_raw_content(articles, _extract_article)
+
     # No pagination on HUD News: everything is on one page.
     return LinkAggregationStep(articles=articles, look_further=False)
 
 
 def scrape(date: datetime.date) -> LinkAggregationResult:
+    _extract_article.cache_clear()
+
     step = _scrape_page(NEWS_URL, date)
     return LinkAggregationResult.from_steps([step])
 
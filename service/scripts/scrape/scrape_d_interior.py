@@ -1,11 +1,12 @@
 import os
 import sys
+import re
 import datetime
 import logging
-from urllib.parse import urljoin
+from functools import lru_cache
 
-import requests
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import SoupStrainer
 
 # Ensure project root is importable (matches existing scraper style)
 _service_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -16,32 +17,35 @@ from models import ArticleLink, LinkAggregationStep, LinkAggregationResult
 import util.scrape_utils as SU
 
 BASE_URL = "https://www.doi.gov"
+log = logging.getLogger(__name__)
 LIST_URL_TEMPLATE = "https://www.doi.gov/news?page={{PAGE}}"
 
 _HDRS = {}
 
+# Listing selectors
+_CARD_SEL = sv.compile("article.node--type-press-release")
+_DATE_SEL = sv.compile(".publication-info--date")
+# Only the cards are needed from the listing page; skip building the rest of the tree
+_CARD_STRAINER = SoupStrainer("article", class_=re.compile(r"(^|\s)node--type-press-release(\s|$)"))
 
+
+@lru_cache(maxsize=512)
 def _extract(article_url: str) -> str:
     """
     Fetch a DOI press release page and return the main article HTML as a string.
     We prefer the <article> node (press release body) when present; otherwise fall
     back to <main>.
     """
-    resp = requests.get(article_url, headers=_HDRS, timeout=30, allow_redirects=True)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.content, "html.parser")
-    logging.getLogger(__name__).info(f"Scraped Content Page {article_url}")
-
-    main = soup.find("main")
-    # Try to grab the press release article body.
-    art = None
-    if main:
-        art = main.find("article")
-    if not art:
-        art = soup.find("article")
-
-    node = art or main or soup.body or soup
-    return str(node)
+    html = SU.extract_main(
+        article_url,
+        headers=_HDRS,
+        strip_tags=(),
+        roots=(".//main//article", ".//article", ".//main"),
+    )
+    # Runs once per article; skip the f-string when INFO is off.
+    if log.isEnabledFor(logging.INFO):
+        log.info(f"Scraped Content Page {article_url}")
+    return html
 
 
 def _parse_card_date(date_text: str) -> datetime.date:
@@ -50,14 +54,12 @@ def _parse_card_date(date_text: str) -> datetime.date:
 
 
 def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
-    resp = requests.get(url, headers=_HDRS, timeout=30, allow_redirects=True)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.content, "html.parser")
-    logging.getLogger(__name__).info(f"Scraped {url}")
+    soup = SU.fetch_soup(url, headers=_HDRS, strainer=_CARD_STRAINER)
+    log.info(f"Scraped {url}")
 
     # Each press release card is an <article> with node--type-press-release.
-    cards = soup.select("article.node--type-press-release")
-    logging.getLogger(__name__).info(f"Found {len(cards)} press release cards on {url}")
+    cards = _CARD_SEL.select(soup)
+    log.info(f"Found {len(cards)} press release cards on {url}")
 
     if not cards:
         return LinkAggregationStep(articles=[], look_further=False)
@@ -66,7 +68,7 @@ def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
     look_further = True
 
     for card in cards:
-        date_el = card.select_one(".publication-info--date")
+        date_el = _DATE_SEL.select_one(card)
         if not date_el:
             # Skip malformed cards, but keep scanning.
             continue
@@ -92,7 +94,7 @@ def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
             continue
 
         title = a.get_text(" ", strip=True)
-        link = urljoin(BASE_URL, a["href"])
+        link = SU.fast_urljoin(BASE_URL, a["href"])
 
         articles.append(
             ArticleLink(
@@ -101,11 +103,13 @@ def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
                 date=published,
                 tags=["Department of the Interior"],
                 process_posturing=True,
-                raw_content=_extract(link),
+                raw_content="",
             )
         )
 
-    logging.getLogger(__name__).info(
+    SU.fill_raw_content(articles, _extract)
+
+    log.info(
         f"Processed {len(articles)} articles from {url}. Look Further: {look_further}"
     )
     return LinkAggregationStep(articles=articles, look_further=look_further)
@@ -116,6 +120,8 @@ def scrape(date: datetime.date) -> LinkAggregationResult:
     Scrape DOI Press Releases list pages until we go past `date`.
     Pages are zero-indexed (?page=0, ?page=1, ...).
     """
+    _extract.cache_clear()
+
     return SU.iter_scrape(LIST_URL_TEMPLATE, 0, date, _scrape_page)
 
 
@@ -2,10 +2,14 @@ import os
 import sys
 import datetime
 import logging
-from urllib.parse import urljoin
+from functools import lru_cache
+from typing import Optional
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from lxml import etree
+from bs4 import BeautifulSoup, SoupStrainer
 
 _service_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 if _service_dir not in sys.path:
@@ -22,79 +26,96 @@ HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 }
 
+# Listing selectors
+_ROW_SEL = sv.compile("article.news-content-listing")
+_TITLE_SEL = sv.compile("h2.news-title a")
+_NODE_TYPE_SEL = sv.compile(".node-type")
+_DATE_SEL = sv.compile(".node-date time")
+_NEXT_SEL = sv.compile('a[rel="next"], li.pager__item--next a, a[title*="next" i]')
+# Listing pages only need the result <article>s and the pager (<nav>); the
+# strained tree drops their wrappers, hence the bare article selector above.
+_LISTING_STRAINER = SoupStrainer(["article", "nav"])
 
+# justice.gov is Drupal SSR, so article pages are fetched with plain requests
+# and only rendered in a browser when that fails or lacks a <main>. Set
+# DOJ_USE_PLAYWRIGHT=1 to render every page (listing and articles) in a browser.
+_USE_PLAYWRIGHT = bool(os.getenv("DOJ_USE_PLAYWRIGHT"))
+
+
+def _fetch_root(url: str) -> Optional[lxml.html.HtmlElement]:
+    if not _USE_PLAYWRIGHT:
+        try:
+            content = SU.fetch(url, headers=HEADERS)
+            root = SU.parse_html(content) if content else None
+            if root is not None and root.find(".//main") is not None:
+                return root
+            LOGGER.info(f"No <main> in static HTML for {url}; rendering with Playwright")
+        except requests.RequestException as e:
+            LOGGER.info(f"Plain GET failed for {url} ({e}); rendering with Playwright")
+
+    content = SU.fetch(url, headers=HEADERS, use_playwright=True, try_requests="dont")
+    return SU.parse_html(content) if content else None
+
+
+@lru_cache(maxsize=512)
 def _extract(article_url: str) -> str:
     """Fetch and return main content HTML for an individual DOJ news item."""
-    resp = SU.playwright_get(article_url, timeout=30, headers=HEADERS)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.content, "html.parser")
-
-    main = soup.find("main")
-    if main:
-        # remove obvious non-content blocks if present
-        for sel in [
-            ".usdoj_overlay",
-            "nav",
-            "header",
-            "footer",
-            "script",
-            "style",
-        ]:
-            for t in main.select(sel):
-                t.decompose()
-        return str(main)
+    root = _fetch_root(article_url)
+    if root is None:
+        return ""
+
+    main = root.find(".//main")
+    if main is not None:
+        # remove obvious non-content blocks if present, in C rather than
+        # per-selector select()/decompose() walks
+        for overlay in main.find_class("usdoj_overlay"):
+            overlay.drop_tree()
+        etree.strip_elements(main, "nav", "header", "footer", "script", "style", with_tail=False)
+        return lxml.html.tostring(main, encoding="unicode")
 
     # Fallback
-    body = soup.find("body")
-    return str(body) if body else resp.text
+    body = root.find("body")
+    return lxml.html.tostring(body if body is not None else root, encoding="unicode")
 
 
 def _has_next_page(soup: BeautifulSoup) -> bool:
     # Be permissive: Drupal pagers can vary.
-    if soup.select_one('a[rel="next"]'):
-        return True
-    if soup.select_one("li.pager__item--next a"):
-        return True
-    if soup.select_one('a[title*="next" i]'):
-        return True
-    return False
+    return _NEXT_SEL.select_one(soup) is not None
 
 
 def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
-    resp = SU.playwright_get(url, timeout=30, headers=HEADERS)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.content, "html.parser")
+    soup = SU.fetch_soup(url, headers=HEADERS, use_playwright=_USE_PLAYWRIGHT, try_requests="dont", strainer=_LISTING_STRAINER)
     LOGGER.info(f"Scraped {url}")
 
-    rows = soup.select("div.rows-wrapper div.views-row article.news-content-listing")
+    rows = _ROW_SEL.select(soup)
     LOGGER.info(f"Found {len(rows)} rows on {url}")
 
     articles = []
     for art in rows:
-        title_a = art.select_one("h2.news-title a")
+        title_a = _TITLE_SEL.select_one(art)
         if not title_a:
             continue
 
         title = title_a.get_text(strip=True)
         href = title_a.get("href", "").strip()
-        link = urljoin(BASE, href)
+        link = SU.fast_urljoin(BASE, href)
 
-        node_type = art.select_one(".node-type")
+        node_type = _NODE_TYPE_SEL.select_one(art)
         tag = node_type.get_text(strip=True) if node_type else "News"
 
-        time_el = art.select_one(".node-date time")
+        time_el = _DATE_SEL.select_one(art)
         if not time_el or not time_el.get("datetime"):
             continue
 
-        # Example in provided HTML: 2025-12-12T12:00:00Z
+        # Fixed shape, e.g. 2025-12-12T12:00:00Z: slice the date fields out
+        # rather than building a tz-aware datetime just to call .date().
         dt_raw = time_el["datetime"].strip()
         try:
-            item_date = datetime.datetime.fromisoformat(dt_raw.replace("Z", "+00:00")).date()
-        except Exception:
+            item_date = datetime.date(int(dt_raw[0:4]), int(dt_raw[5:7]), int(dt_raw[8:10]))
+        except ValueError:
             # Fallback: visible text like "December 12, 2025"
-            try:
-                item_date = datetime.datetime.strptime(time_el.get_text(strip=True), "%B %d, %Y").date()
-            except Exception:
+            item_date = SU.parse_long_date(time_el.get_text(strip=True))
+            if not item_date:
                 continue
 
         # This query should already constrain dates, but keep a guardrail:
@@ -108,10 +129,12 @@ def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
                 date=item_date,
                 tags=["Department of Justice", tag],
                 process_posturing=True,
-                raw_content=_extract(link),
+                raw_content="",
             )
         )
 
+    SU.fill_raw_content(articles, _extract)
+
     # Keep paginating if site exposes a next link AND we got at least one result.
     look_further = bool(articles) and _has_next_page(soup)
     LOGGER.info(f"Processed {len(articles)} articles from {url}. Look further: {look_further}")
@@ -124,6 +147,8 @@ def scrape(scrape_date: datetime.date) -> LinkAggregationResult:
     Per requirement: end_date must be ticked +1 day from scrape_date.
     Pages are zero-indexed.
     """
+    _extract.cache_clear()
+
     start_date = scrape_date.isoformat()
     end_date = (scrape_date + datetime.timedelta(days=1)).isoformat()
 
@@ -22,7 +22,8 @@ def _scrape_feed(feed_url: str, scrape_date: datetime.date) -> LinkAggregationSt
     Pull DOL releases RSS and return only items whose published date == scrape_date.
     Assumes feed is newest-first; once we see an item older than scrape_date, we stop.
     """
-    items = SU.read_rss_feed(feed_url)  # :contentReference[oaicite:5]{index=5}
+    # Conditional GET: an unchanged feed comes back 304 and reuses the cached items.
+    items = SU.read_rss_feed(feed_url, conditional=True)  # :contentReference[oaicite:5]{index=5}
     articles = []
     look_further = True
 
@@ -2,14 +2,14 @@ import os
 import sys
 import datetime
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 # Ensure service root is importable
 _service_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 if _service_dir not in sys.path:
     sys.path.insert(0, _service_dir)
 
-from models import ArticleLink, LinkAggregationResult, LinkAggregationStep  # :contentReference[oaicite:0]{index=0}
+from models import ArticleLink, LinkAggregationResult  # :contentReference[oaicite:0]{index=0}
 import util.scrape_utils as SU  # :contentReference[oaicite:1]{index=1}
 
 
@@ -32,6 +32,9 @@ STATE_RSS_FEEDS: List[Tuple[str, str]] = [
     ("https://www.state.gov/rss-feed/western-hemisphere/feed/", "Western Hemisphere"),
 ]
 
+# Older-than-target items seen in one feed before the rest of it is skipped.
+_STALE_PATIENCE = 3
+
 
 def _to_date(dt: Optional[datetime.datetime]) -> Optional[datetime.date]:
     if not dt:
@@ -45,43 +48,74 @@ def _to_date(dt: Optional[datetime.datetime]) -> Optional[datetime.date]:
     return dt.date()
 
 
+def _read_feed(feed_url: str) -> Optional[List[Dict]]:
+    """Read one feed; None (logged) on failure so one bad feed doesn't sink the rest."""
+    try:
+        # Conditional GET: an unchanged feed comes back 304 and reuses the cached items.
+        items = SU.read_rss_feed(feed_url, conditional=True)  # :contentReference[oaicite:2]{index=2}
+    except Exception as e:
+        LOGGER.exception(f"Failed to read RSS feed {feed_url}: {e}")
+        return None
+    LOGGER.info(f"Read {len(items)} items from {feed_url}")
+    return items
+
+
 def scrape(date: datetime.date) -> LinkAggregationResult:
     """
     Ingest State.gov RSS feeds, filter to `date`, and deduplicate by link.
     If an item appears in multiple feeds, it inherits all tags.
     """
     by_link: Dict[str, ArticleLink] = {}
+    merged_tags: Dict[str, Set[str]] = {}
+    window_lo = date - datetime.timedelta(days=1)
+    window_hi = date + datetime.timedelta(days=1)
 
-    for feed_url, feed_tag in STATE_RSS_FEEDS:
-        try:
-            items = SU.read_rss_feed(feed_url)  # :contentReference[oaicite:2]{index=2}
-        except Exception as e:
-            LOGGER.exception(f"Failed to read RSS feed {feed_url}: {e}")
-            continue
+    # The feeds are independent round trips; fetch them concurrently and
+    # merge afterwards in STATE_RSS_FEEDS order.
+    feed_items = SU.map_concurrent(_read_feed, [url for url, _ in STATE_RSS_FEEDS])
 
-        LOGGER.info(f"Read {len(items)} items from {feed_url}")
+    for (feed_url, feed_tag), items in zip(STATE_RSS_FEEDS, feed_items):
+        if items is None:
+            continue
 
+        stale = 0
         for it in items:
+            pub_dt = it.get("published")
+            # Only a timestamp within a day of the target can land on it after
+            # UTC normalization; everything else is compared as-is.
+            if pub_dt and window_lo <= pub_dt.date() <= window_hi:
+                item_date = _to_date(pub_dt)
+            else:
+                item_date = pub_dt.date() if pub_dt else None
+            if item_date and item_date < date:
+                # Feeds are newest-first; tolerate a few out-of-order items
+                # before concluding the rest of the feed is older too.
+                stale += 1
+                if stale >= _STALE_PATIENCE:
+                    break
+                continue
+
             title = (it.get("title") or "").strip()
             link = (it.get("link") or "").strip()
-            pub_dt = it.get("published")
             summary = it.get("summary") or ""
 
-            item_date = _to_date(pub_dt)
             if not title or not link or not item_date:
                 continue
 
             if item_date != date:
                 continue
 
-            if link in by_link:
-                # Merge tags for duplicates across feeds
-                existing = by_link[link]
-                merged = set(existing.tags or [])
+            # Key on the canonical form so trivial variants (trailing slash,
+            # query order) merge; the stored ArticleLink keeps the original.
+            key = SU.canonical_url(link)
+            if key in by_link:
+                # Merge tags for duplicates across feeds; sorted once at the end
+                merged = merged_tags.get(key)
+                if merged is None:
+                    merged = merged_tags[key] = set(by_link[key].tags or [])
                 merged.add(feed_tag)
-                existing.tags = sorted(merged)
             else:
-                by_link[link] = ArticleLink(
+                by_link[key] = ArticleLink(
                     title=title,
                     link=link,
                     date=item_date,
@@ -90,12 +124,15 @@ def scrape(date: datetime.date) -> LinkAggregationResult:
                     process_posturing=True,
                 )
 
+    for key, merged in merged_tags.items():
+        by_link[key].tags = sorted(merged)
+
     articles = list(by_link.values())
     articles.sort(key=lambda a: (a.date, a.title), reverse=True)
 
-    step = LinkAggregationStep(articles=articles, look_further=False)  # :contentReference[oaicite:3]{index=3}
     LOGGER.info(f"State.gov RSS deduped to {len(articles)} articles for {date.isoformat()}")
-    return LinkAggregationResult.from_steps([step])  # :contentReference[oaicite:4]{index=4}
+    # Already in final order; from_steps would only re-sort the same list.
+    return LinkAggregationResult(articles=articles)
 
 
 if __name__ == "__main__":
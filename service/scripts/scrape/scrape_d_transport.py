@@ -3,8 +3,16 @@ import sys
 import re
 import logging
 import datetime
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, TypeVar
 from urllib.parse import urljoin
 
+import lxml.html
+import requests
+import soupsieve as sv
+from lxml import etree
 from bs4 import BeautifulSoup
 
 _service_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -22,62 +30,107 @@ UA_HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 }
 
+# Listing container class matcher
+_VIEW_NEWSROOM_RE = re.compile(r"\bview-newsroom\b")
+# Press-release card selectors
+_CARD_TITLE_SEL = sv.compile("h1 a, h2 a, h3 a")
+_CARD_TIME_SEL = sv.compile("time")
+_CARD_LABEL_SEL = sv.compile("span.label_format")
+# Speeches-table cell selectors
+_SPEECH_TITLE_SEL = sv.compile("td.views-field-title a")
+_SPEECH_DATE_SEL = sv.compile("td.views-field-field-effective-date")
+
+
+def _has_class(cls: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+
+# Article-page cleanup, compiled once: .region-breadcrumb, .sidebar, #sidenav,
+# .list_filter, .list_pagination and nav blocks inside <main>
+_BOILERPLATE_XPATH = etree.XPath(
+    ".//*[" + " or ".join(
+        [_has_class(c) for c in ("region-breadcrumb", "sidebar", "list_filter", "list_pagination")]
+        + ["@id='sidenav'", "self::nav"]
+    ) + "]"
+)
+# Fallback content regions, in preference order
+_MAIN_CONTENT_XPATHS = (
+    etree.XPath(f".//div[{_has_class('main-content')}]"),
+    etree.XPath(f".//section[{_has_class('region-content')}]"),
+)
+
 # -------------------------
 # Helpers
 # -------------------------
 
-def _fetch_soup(url: str) -> BeautifulSoup:
-    resp = SU.playwright_get(url, timeout=30, headers=UA_HEADERS)
+_Doc = TypeVar("_Doc")
+
+
+def _fetch_page(url: str, parse: Callable[[bytes], _Doc], is_complete: Callable[[_Doc], bool]) -> _Doc:
+    """
+    DOT pages are server-rendered, so try a plain GET first and only render
+    with Playwright when that fails or the HTML lacks what `is_complete` wants.
+    """
+    try:
+        doc = parse(SU.fetch(url, headers=UA_HEADERS))
+        if is_complete(doc):
+            return doc
+        LOGGER.info(f"Static HTML incomplete for {url}; rendering with Playwright")
+    except requests.RequestException as e:
+        LOGGER.info(f"Plain GET failed for {url} ({e}); rendering with Playwright")
+
+    resp = SU.playwright_get(url, timeout=30, headers=UA_HEADERS, try_requests="dont")
     resp.raise_for_status()
-    return BeautifulSoup(resp.content, "html.parser")
+    return parse(resp.content)
+
+
+def _parse_soup(content: bytes) -> BeautifulSoup:
+    return BeautifulSoup(content, "lxml")
+
+
+def _has_main(root: lxml.html.HtmlElement) -> bool:
+    return root.find(".//main") is not None
+
+
+def _has_newsroom_view(soup: BeautifulSoup) -> bool:
+    return soup.find("div", class_=_VIEW_NEWSROOM_RE) is not None
 
 
 def _parse_dot_date(date_str: str) -> datetime.date:
     """
     DOT listings use: 'December 12, 2025' or 'September 23, 2025'
     """
-    s = (date_str or "").strip()
-    # Some pages might include extra whitespace/newlines.
-    s = re.sub(r"\s+", " ", s)
-    return datetime.datetime.strptime(s, "%B %d, %Y").date()
+    # Month-table parse (cached, whitespace-tolerant) rather than strptime per row.
+    d = SU.parse_long_date(date_str)
+    if d is None:
+        raise ValueError(f"Unrecognized DOT date: {date_str!r}")
+    return d
 
 
+@lru_cache(maxsize=4096)
 def _extract_article_content(url: str) -> str:
     """
     Best-effort extraction:
     Prefer <article>, else the main content region, else <main>.
     """
-    soup = _fetch_soup(url)
-    main = soup.find("main")
-    if not main:
-        return str(soup)
+    root = _fetch_page(url, SU.parse_html, _has_main)
+    main = root.find(".//main")
+    if main is None:
+        return lxml.html.tostring(root, encoding="unicode")
 
     # Remove common non-content blocks when present
-    for sel in [
-        ".region-breadcrumb",
-        ".sidebar",
-        "#sidenav",
-        ".list_filter",
-        ".list_pagination",
-        "nav",
-    ]:
-        for n in main.select(sel):
-            try:
-                n.decompose()
-            except Exception:
-                pass
-
-    # Prefer the actual article node if present
-    article = main.find("article")
-    if article:
-        return str(article)
-
-    # Fallback to main content column / region-content
-    main_content = main.select_one("div.main-content") or main.select_one("section.region-content")
-    if main_content:
-        return str(main_content)
-
-    return str(main)
+    for n in _BOILERPLATE_XPATH(main):
+        n.drop_tree()
+
+    # Prefer the actual article node if present; fall back to the main
+    # content column / region-content. Serialized by lxml (C) rather than
+    # BeautifulSoup's Python-level str().
+    article = main.find(".//article")
+    for xp in _MAIN_CONTENT_XPATHS:
+        if article is not None:
+            break
+        article = next(iter(xp(main)), None)
+    return lxml.html.tostring(article if article is not None else main, encoding="unicode")
 
 
 def _normalize_link(href: str) -> str:
@@ -96,7 +149,7 @@ def _parse_press_release_cards(soup: BeautifulSoup, scrape_date: datetime.date)
     Press Releases page uses <article class="node__content view--item ..."> cards.
     Title link is inside an <h1> (sometimes h2/h3 variants) and date is in <time>.
     """
-    view = soup.find("div", class_=re.compile(r"\bview-newsroom\b"))
+    view = soup.find("div", class_=_VIEW_NEWSROOM_RE)
     list_news = view.find("div", class_="list_news") if view else None
     if not list_news:
         return LinkAggregationStep(articles=[], look_further=False)
@@ -110,8 +163,7 @@ def _parse_press_release_cards(soup: BeautifulSoup, scrape_date: datetime.date)
 
     for card in cards:
         # Title/link
-        heading = card.find(["h1", "h2", "h3"])
-        a = heading.find("a") if heading else None
+        a = _CARD_TITLE_SEL.select_one(card)
         if not a or not a.get("href"):
             continue
 
@@ -119,7 +171,7 @@ def _parse_press_release_cards(soup: BeautifulSoup, scrape_date: datetime.date)
         link = _normalize_link(a["href"])
 
         # Date
-        t = card.find("time")
+        t = _CARD_TIME_SEL.select_one(card)
         if not t:
             continue
         date_text = t.get_text(" ", strip=True) or ""
@@ -138,7 +190,7 @@ def _parse_press_release_cards(soup: BeautifulSoup, scrape_date: datetime.date)
 
         # Type label (usually "Press Release")
         label = ""
-        label_span = card.find("span", class_=re.compile(r"\blabel_format\b"))
+        label_span = _CARD_LABEL_SEL.select_one(card)
         if label_span:
             label = label_span.get_text(" ", strip=True)
 
@@ -158,7 +210,7 @@ def _parse_press_release_cards(soup: BeautifulSoup, scrape_date: datetime.date)
                     date=dt,
                     tags=tags,
                     process_posturing=True,
-                    raw_content=_extract_article_content(link),
+                    raw_content="",  # filled by SU.fill_raw_content in _parse_page
                 )
             )
 
@@ -171,7 +223,7 @@ def _parse_speeches_table(soup: BeautifulSoup, scrape_date: datetime.date) -> Li
       td.views-field-title a[href]
       td.views-field-field-effective-date (e.g. "March 27, 2025")
     """
-    view = soup.find("div", class_=re.compile(r"\bview-newsroom\b"))
+    view = soup.find("div", class_=_VIEW_NEWSROOM_RE)
     list_news = view.find("div", class_="list_news") if view else None
     if not list_news:
         return LinkAggregationStep(articles=[], look_further=False)
@@ -190,8 +242,8 @@ def _parse_speeches_table(soup: BeautifulSoup, scrape_date: datetime.date) -> Li
     look_further = True
 
     for tr in rows:
-        a = tr.select_one("td.views-field-title a")
-        dtd = tr.select_one("td.views-field-field-effective-date")
+        a = _SPEECH_TITLE_SEL.select_one(tr)
+        dtd = _SPEECH_DATE_SEL.select_one(tr)
         if not a or not a.get("href") or not dtd:
             continue
 
@@ -215,23 +267,29 @@ def _parse_speeches_table(soup: BeautifulSoup, scrape_date: datetime.date) -> Li
                     date=dt,
                     tags=["Department of Transportation", "Speech"],
                     process_posturing=True,
-                    raw_content=_extract_article_content(link),
+                    raw_content="",  # filled by SU.fill_raw_content in _parse_page
                 )
             )
 
     return LinkAggregationStep(articles=articles, look_further=look_further)
 
 
-def _scrape_page(url: str, scrape_date: datetime.date, kind: str) -> LinkAggregationStep:
-    soup = _fetch_soup(url)
+def _fetch_listing(url: str) -> BeautifulSoup:
+    return _fetch_page(url, _parse_soup, _has_newsroom_view)
+
+
+def _parse_page(soup: BeautifulSoup, url: str, scrape_date: datetime.date, kind: str) -> LinkAggregationStep:
     LOGGER.info(f"Scraped DOT listing page: {url}")
 
     if kind == "press_releases":
-        return _parse_press_release_cards(soup, scrape_date)
-    if kind == "speeches":
-        return _parse_speeches_table(soup, scrape_date)
+        step = _parse_press_release_cards(soup, scrape_date)
+    elif kind == "speeches":
+        step = _parse_speeches_table(soup, scrape_date)
+    else:
+        raise ValueError(f"Unknown kind: {kind}")
 
-    raise ValueError(f"Unknown kind: {kind}")
+    SU.fill_raw_content(step.articles, _extract_article_content)
+    return step
 
 
 # -------------------------
@@ -243,27 +301,44 @@ def scrape(date: datetime.date) -> LinkAggregationResult:
     Scrape DOT Press Releases + Speeches for a single target date.
     Pages are zero-indexed.
     """
+    # Press releases and speeches can link the same page; memoize per run only.
+    _extract_article_content.cache_clear()
+
     press_template = "https://www.transportation.gov/newsroom/press-releases?page={{PAGE}}"
     speeches_template = "https://www.transportation.gov/newsroom/speeches?page={{PAGE}}"
 
-    res_press = SU.iter_scrape(
-        press_template,
-        start_page=0,
-        date=date,
-        scrape_fn=lambda url, d: _scrape_page(url, d, "press_releases"),
-    )
-    res_speeches = SU.iter_scrape(
-        speeches_template,
-        start_page=0,
-        date=date,
-        scrape_fn=lambda url, d: _scrape_page(url, d, "speeches"),
-    )
-
-    combined = sorted(
-        (res_press.articles or []) + (res_speeches.articles or []),
+    # The two newsroom sections paginate independently; run them side by side,
+    # each fetching its next listing page while the current one is parsed.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        fut_press = pool.submit(
+            SU.iter_scrape_prefetch,
+            press_template,
+            start_page=0,
+            date=date,
+            fetch_fn=_fetch_listing,
+            parse_fn=lambda soup, url, d: _parse_page(soup, url, d, "press_releases"),
+            prefetch=2,
+        )
+        fut_speeches = pool.submit(
+            SU.iter_scrape_prefetch,
+            speeches_template,
+            start_page=0,
+            date=date,
+            fetch_fn=_fetch_listing,
+            parse_fn=lambda soup, url, d: _parse_page(soup, url, d, "speeches"),
+            prefetch=2,
+        )
+        res_press = fut_press.result()
+        res_speeches = fut_speeches.result()
+
+    # Each result is already newest-first (from_steps sorts), so a single
+    # merge pass replaces concatenate-and-sort.
+    combined = list(heapq.merge(
+        res_press.articles or [],
+        res_speeches.articles or [],
         key=lambda x: x.date,
         reverse=True,
-    )
+    ))
     return LinkAggregationResult(articles=combined)
 
 
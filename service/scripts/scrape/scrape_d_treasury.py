@@ -4,8 +4,10 @@ import datetime
 import logging
 from urllib.parse import urljoin
 
-import requests
+import lxml.html
+import soupsieve as sv
 from bs4 import BeautifulSoup
+from lxml import etree
 
 _service_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 if _service_dir not in sys.path:
@@ -21,6 +23,17 @@ HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 }
 
+# Listing-item selectors
+_HEADLINE_SEL = sv.compile("h3.featured-stories__headline a")
+_TIME_SEL = sv.compile("time.datetime")
+_SUBCATEGORY_SEL = sv.compile("span.subcategory a")
+# div#content-area div.region.region-content
+_REGION_CONTENT_XPATH = etree.XPath(
+    ".//div[@id='content-area']//div["
+    "contains(concat(' ', normalize-space(@class), ' '), ' region ') and "
+    "contains(concat(' ', normalize-space(@class), ' '), ' region-content ')]"
+)
+
 
 def _abs_url(href: str) -> str:
     return urljoin(BASE_URL, href or "")
@@ -31,42 +44,44 @@ def _parse_iso_date(dt_str: str) -> datetime.date:
     dt_str = (dt_str or "").strip()
     if not dt_str:
         raise ValueError("Empty datetime string")
-    if dt_str.endswith("Z"):
-        dt_str = dt_str.replace("Z", "+00:00")
-    return datetime.datetime.fromisoformat(dt_str).date()
+    # The leading YYYY-MM-DD is the date as written; skip time/tz parsing.
+    try:
+        return datetime.date.fromisoformat(dt_str[:10])
+    except ValueError:
+        if dt_str.endswith("Z"):
+            dt_str = dt_str.replace("Z", "+00:00")
+        return datetime.datetime.fromisoformat(dt_str).date()
 
 
 def _extract(url: str) -> str:
-    resp = requests.get(url, headers=HEADERS, timeout=30, allow_redirects=True)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.content, "html.parser")
+    root = SU.parse_html(SU.fetch(url, headers=HEADERS))
 
     logging.getLogger(__name__).info(f"Scraped Content Page {url}")
 
     # Prefer the main content area used on the site.
-    main = soup.select_one("div#content-area div.region.region-content")
-    if not main:
-        main = soup.find("main")
-    if not main:
-        main = soup.body or soup
+    main = next(iter(_REGION_CONTENT_XPATH(root)), None)
+    if main is None:
+        main = root.find(".//main")
+    if main is None:
+        main = root.find("body")
+    if main is None:
+        main = root
 
-    # Light cleanup: remove nav/aside if present within selected main
-    for sel in ["nav", "aside"]:
-        for tag in main.select(sel):
-            tag.decompose()
+    # Light cleanup: remove nav/aside if present within selected main. lxml
+    # strips and serializes in C, unlike bs4 decompose()/str().
+    etree.strip_elements(main, "nav", "aside", with_tail=False)
 
-    return str(main)
+    return lxml.html.tostring(main, encoding="unicode")
 
 
-def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
+def _fetch_listing(url: str) -> BeautifulSoup:
     # Defensive fix in case someone provides "...?x=y?page=0" (double '?')
     if "?page=" in url and "&page=" not in url:
         url = url.replace("?page=", "&page=")
+    return SU.fetch_soup(url, headers=HEADERS)
 
-    resp = requests.get(url, headers=HEADERS, timeout=30, allow_redirects=True)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.content, "html.parser")
 
+def _parse_page(soup: BeautifulSoup, url: str, scrape_date: datetime.date) -> LinkAggregationStep:
     logging.getLogger(__name__).info(f"Scraped {url}")
 
     container = soup.select_one("div.featured-stories.content--2col div.content--2col__body")
@@ -87,23 +102,26 @@ def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
     look_further = True
 
     for item in items:
-        a = item.select_one("h3.featured-stories__headline a")
-        t = item.select_one("time.datetime")
+        a = _HEADLINE_SEL.select_one(item)
+        t = _TIME_SEL.select_one(item)
 
         if not a or not t:
             continue
 
         title = a.get_text(strip=True)
         link = _abs_url(a.get("href", "").strip())
-        if not title or not link or link in seen:
+        if not title or not link:
+            continue
+        key = SU.canonical_url(link)
+        if key in seen:
             continue
-        seen.add(link)
+        seen.add(key)
 
         dt_attr = t.get("datetime", "").strip()
         try:
-            item_date = _parse_iso_date(dt_attr) if dt_attr else datetime.datetime.strptime(
-                t.get_text(strip=True), "%B %d, %Y"
-            ).date()
+            item_date = _parse_iso_date(dt_attr) if dt_attr else SU.parse_long_date(t.get_text(strip=True))
+            if item_date is None:
+                raise ValueError("Unrecognized date text")
         except Exception:
             # If date parsing fails, skip item rather than breaking the whole scrape
             logging.getLogger(__name__).warning(f"Could not parse date for {link}")
@@ -118,7 +136,7 @@ def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
         if item_date != scrape_date:
             continue
 
-        subcat = item.select_one("span.subcategory a")
+        subcat = _SUBCATEGORY_SEL.select_one(item)
         tag = subcat.get_text(strip=True) if subcat else "Press Releases"
 
         articles.append(
@@ -128,10 +146,12 @@ def _scrape_page(url: str, scrape_date: datetime.date) -> LinkAggregationStep:
                 date=item_date,
                 tags=["Department of the Treasury", tag],
                 process_posturing=True,
-                raw_content=_extract(link),
+                raw_content="",
             )
         )
 
+    SU.fill_raw_content(articles, _extract)
+
     if not articles:
         # With a date-filtered query, no results usually means no reason to keep paginating.
         look_further = False
@@ -150,7 +170,8 @@ def scrape(date: datetime.date) -> LinkAggregationResult:
         f"&publication-end-date={date.isoformat()}"
         "&page={{PAGE}}"
     )
-    return SU.iter_scrape(url_template, 0, date, _scrape_page)
+    # Fetch the next listing page while the current one is parsed.
+    return SU.iter_scrape_prefetch(url_template, 0, date, _fetch_listing, _parse_page, prefetch=2)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@ import os
 import sys
 import datetime
 import logging
-from typing import Dict, List
+from typing import Dict, List, Set
 
 # Keep consistent with other scrapers: add service root to path so we can import models + utils.
 _service_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -47,12 +47,22 @@ def scrape(date: datetime.date) -> LinkAggregationResult:
     logger.info(f"Scraping War.gov RSS feeds for date={date.isoformat()}")
 
     by_link: Dict[str, ArticleLink] = {}
+    tags_map: Dict[str, List[str]] = {}
+    tags_seen: Dict[str, Set[str]] = {}
 
-    for category, feed_url in RSS_FEEDS.items():
+    # The feeds are independent round trips; fetch them concurrently and
+    # merge afterwards in RSS_FEEDS order.
+    def _read(entry):
+        category, feed_url = entry
         try:
-            items = SU.read_rss_feed(feed_url)
+            return SU.read_rss_feed(feed_url, conditional=True)
         except Exception as e:
             logger.exception(f"Failed to read RSS feed {category}: {feed_url} ({e})")
+            return None
+
+    feeds = list(RSS_FEEDS.items())
+    for (category, feed_url), items in zip(feeds, SU.map_concurrent(_read, feeds)):
+        if items is None:
             continue
 
         for it in items:
@@ -72,21 +82,26 @@ def scrape(date: datetime.date) -> LinkAggregationResult:
                 continue
 
             if link in by_link:
-                existing = by_link[link]
-                # Merge tags (dedupe while preserving stable order).
-                merged = list(dict.fromkeys([*existing.tags, category]))
-                by_link[link] = existing.copy(update={"tags": merged})
+                # Merge tags (dedupe while preserving stable order); applied once below.
+                if category not in tags_seen[link]:
+                    tags_seen[link].add(category)
+                    tags_map[link].append(category)
                 continue
 
+            tags_map[link] = ["Department of War", category]
+            tags_seen[link] = set(tags_map[link])
             by_link[link] = ArticleLink(
                 title=title,
                 link=link,
                 date=pub_date,
-                tags=["Department of War", category],
+                tags=tags_map[link],
                 raw_content=summary,
                 process_posturing=True,
             )
 
+    for link, article in by_link.items():
+        article.tags = tags_map[link]
+
     articles: List[ArticleLink] = list(by_link.values())
     # Deterministic ordering: newest first, then title.
     articles = sorted(articles, key=lambda a: (a.date, a.title), reverse=True)
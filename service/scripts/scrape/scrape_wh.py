@@ -1,7 +1,6 @@
 import os
 import sys
-from bs4 import BeautifulSoup
-import requests
+from bs4 import BeautifulSoup, SoupStrainer
 _service_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 if _service_dir not in sys.path:
     sys.path.insert(0, _service_dir)
@@ -9,20 +8,25 @@ from models import ArticleLink, LinkAggregationStep, LinkAggregationResult
 import datetime
 import util.scrape_utils as SU
 import logging
+from functools import partial
+
+# link -> extracted content for pages already processed, persisted between runs.
+_SEEN: dict[str, str] = {}
+
+_MAIN_STRAINER = SoupStrainer("main")
 
 def _extract(url: str) -> str:
-    response = requests.get(url, allow_redirects=True)
-    soup = BeautifulSoup(response.content, 'html.parser')
+    soup = SU.fetch_soup(url, headers={}, strainer=_MAIN_STRAINER)
     logging.getLogger(__name__).info(f"Scraped Content Page {url}")
-    body = soup.find("main").children.__next__()
+    body = next(soup.find("main").children)
     # Decompose first child of body with class "wp-block-whitehouse-topper" and remove it.
-    if body.find(class_="wp-block-whitehouse-topper"):
-        body.find(class_="wp-block-whitehouse-topper").decompose()
+    topper = body.find(class_="wp-block-whitehouse-topper")
+    if topper:
+        topper.decompose()
     return str(body)
 
-def _scrape_page(url, scrape_date: datetime.date):
-    response = requests.get(url, allow_redirects=True)
-    soup = BeautifulSoup(response.content, 'html.parser')
+def _scrape_page(url, scrape_date: datetime.date, collection=None):
+    soup = BeautifulSoup(SU.fetch(url, headers={}), 'html.parser')
     logging.getLogger(__name__).info(f"Scraped {url}")
     # Look for H2 elements and get their parents.
     h2_elements = soup.find_all('h2')
@@ -41,7 +45,7 @@ def _scrape_page(url, scrape_date: datetime.date):
         article_type = sibling.find_all('div')[0].text.strip()
         date = sibling.find_all('div')[1].text.strip()
         # Process date to datetime.date. The format of the date is "Month Day, Year" (e.g., "October 10, 2023").
-        date = datetime.datetime.strptime(date, '%B %d, %Y').date()
+        date = SU.parse_long_date(date) or datetime.datetime.strptime(date, '%B %d, %Y').date()
         # If the date is not the same as the input date, stop looking further.
         if date != scrape_date:
             look_further = False
@@ -54,17 +58,37 @@ def _scrape_page(url, scrape_date: datetime.date):
             date=date, 
             tags=["White House", article_type], 
             process_posturing=True, 
-            raw_content=_extract(link)
+            raw_content=""
         ))
+    # Links already stored in `collection` are left out of the step entirely, so
+    # their pages aren't fetched and no empty body is handed to the upsert.
+    if collection is not None and articles:
+        try:
+            known = set(collection.distinct("link", {"link": {"$in": [a.link for a in articles]}}))
+            articles = [a for a in articles if a.link not in known]
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Could not look up stored links: {e}")
+    # Pages extracted on a previous run are reused as-is; only new links hit the network.
+    fresh = [a for a in articles if a.link not in _SEEN]
+    for a in articles:
+        if a.link in _SEEN:
+            a.raw_content = _SEEN[a.link]
+    # Article pages are independent fetches over the shared session; pull them concurrently.
+    for article, content in zip(fresh, SU.map_concurrent(_extract, [a.link for a in fresh], max_workers=10)):
+        article.raw_content = content
+        _SEEN[article.link] = content
     res = LinkAggregationStep(articles=articles, look_further=look_further)       
     logging.getLogger(__name__).info(f"Processed {len(articles)} articles from {url}. Look Further: {look_further}")
     
     return res
 
-def scrape(date: datetime.date):
+def scrape(date: datetime.date, collection=None):
     # Define the URL to scrape
     url_template = "https://www.whitehouse.gov/news/page/{{PAGE}}/"
-    res = SU.iter_scrape(url_template, 1, date, _scrape_page)
+    _SEEN.clear()
+    _SEEN.update(SU.load_seen_pages("whitehouse"))
+    res = SU.iter_scrape(url_template, 1, date, partial(_scrape_page, collection=collection))
+    SU.save_seen_pages("whitehouse", _SEEN)
     
     return res
 
@@ -1,13 +1,15 @@
 import datetime
+import io
 import json
 import logging
+import multiprocessing
 import os
 import re
 import sys
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, Iterable, List, Optional
-
-import requests
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
 
 _HERE = os.path.dirname(__file__)
 _SERVICE_ROOT = os.path.abspath(os.path.join(_HERE, '..', '..'))
@@ -15,16 +17,36 @@ if _SERVICE_ROOT not in sys.path:
     sys.path.insert(0, _SERVICE_ROOT)
 from util.whisper_transcribe import extract_whisper_text
 from models import ArticleLink, LinkAggregationResult
+import util.scrape_utils as SU
 
 LOGGER = logging.getLogger(__name__)
 
+# Videos transcribed in parallel; each worker process loads its own model.
+_WHISPER_WORKERS = int(os.getenv("WHISPER_WORKERS", "2"))
+# Transcripts by video id; Whisper output is deterministic per video, so re-runs reuse it.
+_WHISPER_CACHE_DIR = os.getenv("WHISPER_CACHE_DIR") or os.path.join(_SERVICE_ROOT, ".cache", "whisper")
+_VIDEO_ID_RE = re.compile(r"[\w-]{6,}", re.ASCII)
+
 #DEFAULT_CHANNELS: List[Dict[str, Any]] = []
 
-_FEED_NS = {
-    "atom": "http://www.w3.org/2005/Atom",
-    "media": "http://search.yahoo.com/mrss/",
-    "yt": "http://www.youtube.com/xml/schemas/2015",
-}
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_MEDIA = "{http://search.yahoo.com/mrss/}"
+_YT = "{http://www.youtube.com/xml/schemas/2015}"
+_ENTRY_TAG = _ATOM + "entry"
+_TITLE_TAG = _ATOM + "title"
+_LINK_TAG = _ATOM + "link"
+_PUBLISHED_TAG = _ATOM + "published"
+_DURATION_PATH = _MEDIA + "group/" + _YT + "duration"
+_LIVE_STATUS_TAG = _YT + "liveBroadcastContent"
+
+# Any of the places a channel page exposes its id; one scan finds the first.
+_CHANNEL_ID_RE = re.compile(
+    r'channel_id=([a-zA-Z0-9_-]+)'
+    r'|"channelId":"(UC[\w-]+)"'
+    r'|itemprop="channelId"\s+content="(UC[\w-]+)"',
+    re.ASCII,
+)
+_CHANNEL_PATH_RE = re.compile(r"/channel/(UC[\w-]+)", re.ASCII)
 
 
 def _load_channels() -> List[Dict[str, Any]]:
@@ -40,15 +62,10 @@ def _load_channels() -> List[Dict[str, Any]]:
 
 
 def _extract_channel_id_from_html(html: str) -> Optional[str]:
-    for pattern in (
-        r'channel_id=([a-zA-Z0-9_-]*)',
-        r'"channelId":"(UC[\w-]+)"',
-        r'itemprop="channelId"\s+content="(UC[\w-]+)"',
-    ):
-        match = re.search(pattern, html)
-        if match:
-            return match.group(1)
-    return None
+    match = _CHANNEL_ID_RE.search(html)
+    if match is None:
+        return None
+    return next((g for g in match.groups() if g), None)
 
 
 def _resolve_feed_url(channel: Dict[str, Any]) -> Optional[str]:
@@ -62,11 +79,11 @@ def _resolve_feed_url(channel: Dict[str, Any]) -> Optional[str]:
     if not isinstance(channel_url, str) or not channel_url.strip():
         return None
     channel_url = channel_url.strip()
-    match = re.search(r"/channel/(UC[\w-]+)", channel_url)
+    match = _CHANNEL_PATH_RE.search(channel_url)
     if match:
         return f"https://www.youtube.com/feeds/videos.xml?channel_id={match.group(1)}"
     try:
-        resp = requests.get(channel_url, timeout=20)
+        resp = SU.SESSION.get(channel_url, timeout=20)
         resp.raise_for_status()
         channel_id = _extract_channel_id_from_html(resp.text)
         if channel_id:
@@ -76,17 +93,19 @@ def _resolve_feed_url(channel: Dict[str, Any]) -> Optional[str]:
     return None
 
 
-def _iter_feed_entries(xml_text: str) -> Iterable[Dict[str, Any]]:
-    root = ET.fromstring(xml_text)
-    for entry in root.findall("atom:entry", _FEED_NS):
-        title = entry.findtext("atom:title", default="", namespaces=_FEED_NS)
-        link_el = entry.find("atom:link", _FEED_NS)
+def _iter_feed_entries(xml_bytes: bytes) -> Iterable[Dict[str, Any]]:
+    # Stream the feed and drop each <entry> once read so memory stays per-entry.
+    for _, entry in ET.iterparse(io.BytesIO(xml_bytes), events=("end",)):
+        if entry.tag != _ENTRY_TAG:
+            continue
+        title = entry.findtext(_TITLE_TAG, default="")
+        link_el = entry.find(_LINK_TAG)
         link = ""
         if link_el is not None:
             link = link_el.attrib.get("href", "") or ""
-        published = entry.findtext("atom:published", default="", namespaces=_FEED_NS)
+        published = entry.findtext(_PUBLISHED_TAG, default="")
         duration_seconds = None
-        duration_el = entry.find("media:group/yt:duration", _FEED_NS)
+        duration_el = entry.find(_DURATION_PATH)
         if duration_el is not None:
             raw_duration = duration_el.attrib.get("seconds")
             try:
@@ -94,11 +113,8 @@ def _iter_feed_entries(xml_text: str) -> Iterable[Dict[str, Any]]:
                     duration_seconds = int(raw_duration)
             except ValueError:
                 duration_seconds = None
-        live_status = entry.findtext(
-            "yt:liveBroadcastContent",
-            default="",
-            namespaces=_FEED_NS,
-        ).strip()
+        live_status = entry.findtext(_LIVE_STATUS_TAG, default="").strip()
+        entry.clear()
         yield {
             "title": title.strip(),
             "link": link.strip(),
@@ -129,16 +145,89 @@ def _build_tags(channel: Dict[str, Any]) -> List[str]:
     return tags
 
 
-def _fetch_feed(feed_url: str) -> Optional[str]:
+def _fetch_feed(feed_url: str) -> Optional[bytes]:
     try:
-        resp = requests.get(feed_url, timeout=20)
+        resp = SU.SESSION.get(feed_url, timeout=20)
         resp.raise_for_status()
-        return resp.text
+        return resp.content
     except Exception as exc:
         LOGGER.warning("Failed to fetch feed %s err=%s", feed_url, exc)
         return None
 
 
+def _load_channel_feed(channel: Dict[str, Any]) -> Optional[Tuple[str, bytes]]:
+    feed_url = _resolve_feed_url(channel)
+    if not feed_url:
+        LOGGER.warning("Skipping channel with missing feed resolution: %s", channel)
+        return None
+    xml_bytes = _fetch_feed(feed_url)
+    if not xml_bytes:
+        return None
+    return feed_url, xml_bytes
+
+
+def _video_id(link: str) -> Optional[str]:
+    parts = urlsplit(link)
+    host = parts.netloc.lower()
+    if host.endswith("youtu.be"):
+        vid = parts.path.strip("/").split("/")[0]
+    else:
+        vid = (parse_qs(parts.query).get("v") or [""])[0]
+    return vid if _VIDEO_ID_RE.fullmatch(vid) else None
+
+
+def _transcript_cache_path(vid: str) -> str:
+    return os.path.join(_WHISPER_CACHE_DIR, vid + ".txt")
+
+
+def _load_transcript(vid: Optional[str]) -> Optional[str]:
+    if not vid:
+        return None
+    try:
+        with open(_transcript_cache_path(vid), "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _save_transcript(vid: Optional[str], text: str) -> None:
+    # Failed transcriptions come back empty; leave those uncached so they're retried.
+    if not vid or not text:
+        return
+    path = _transcript_cache_path(vid)
+    try:
+        os.makedirs(_WHISPER_CACHE_DIR, exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(path + ".tmp", path)
+    except OSError as exc:
+        LOGGER.warning("Could not cache transcript for %s err=%s", vid, exc)
+
+
+def _transcribe_all(links: List[str]) -> List[str]:
+    """Run extract_whisper_text over `links`, in order.
+
+    Transcripts are cached on disk by video id, so only unseen videos are
+    transcribed. Transcription is CPU-bound and holds the GIL, so more than
+    one video goes to a process pool (spawned, so children don't inherit
+    torch state).
+    """
+    vids = [_video_id(link) for link in links]
+    texts = [_load_transcript(vid) for vid in vids]
+    todo = [i for i, text in enumerate(texts) if text is None]
+    todo_links = [links[i] for i in todo]
+    if len(todo_links) <= 1 or _WHISPER_WORKERS <= 1:
+        fresh = [extract_whisper_text(link) for link in todo_links]
+    else:
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(_WHISPER_WORKERS, len(todo_links)), mp_context=ctx) as pool:
+            fresh = list(pool.map(extract_whisper_text, todo_links))
+    for i, text in zip(todo, fresh):
+        texts[i] = text
+        _save_transcript(vids[i], text)
+    return texts
+
+
 def scrape(date: datetime.date, channels: Optional[List[Dict[str, Any]]] = None) -> LinkAggregationResult:
     if channels is None:
         channels = _load_channels()
@@ -146,16 +235,13 @@ def scrape(date: datetime.date, channels: Optional[List[Dict[str, Any]]] = None)
         LOGGER.info("No YouTube channels configured; returning empty result.")
         return LinkAggregationResult(articles=[])
 
-    articles: List[ArticleLink] = []
-    for channel in channels:
-        feed_url = _resolve_feed_url(channel)
-        if not feed_url:
-            LOGGER.warning("Skipping channel with missing feed resolution: %s", channel)
+    # Channel feeds are independent round trips; fetch them concurrently.
+    pending: List[Tuple[Dict[str, Any], Dict[str, Any], datetime.date]] = []
+    for channel, feed in zip(channels, SU.map_concurrent(_load_channel_feed, channels)):
+        if feed is None:
             continue
-        xml_text = _fetch_feed(feed_url)
-        if not xml_text:
-            continue
-        for entry in _iter_feed_entries(xml_text):
+        feed_url, xml_bytes = feed
+        for entry in _iter_feed_entries(xml_bytes):
             published_date = _parse_published_date(entry.get("published", ""))
             if published_date != date:
                 continue
@@ -168,18 +254,24 @@ def scrape(date: datetime.date, channels: Optional[List[Dict[str, Any]]] = None)
             link = entry.get("link", "")
             if not link:
                 continue
-            raw_content = extract_whisper_text(link)
-            articles.append(
-                ArticleLink(
-                    title=entry.get("title", "") or link,
-                    link=link,
-                    date=published_date,
-                    tags=_build_tags(channel),
-                    raw_content=raw_content,
-                    process_posturing=False,
-                )
-            )
+            pending.append((channel, entry, published_date))
         LOGGER.info("Processed YouTube feed %s", feed_url)
+
+    transcripts = _transcribe_all([entry["link"] for _, entry, _ in pending])
+
+    articles: List[ArticleLink] = []
+    for (channel, entry, published_date), raw_content in zip(pending, transcripts):
+        link = entry["link"]
+        articles.append(
+            ArticleLink(
+                title=entry.get("title", "") or link,
+                link=link,
+                date=published_date,
+                tags=_build_tags(channel),
+                raw_content=raw_content,
+                process_posturing=False,
+            )
+        )
     return LinkAggregationResult(articles=articles)
 
 
@@ -2,8 +2,13 @@ import os
 import sys
 import datetime
 import importlib.util
+import inspect
 import logging
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
+from types import ModuleType
+from typing import Dict, List, Tuple
 
 _HERE = os.path.dirname(__file__)
 _SERVICE_ROOT = os.path.abspath(os.path.join(_HERE, '..'))
@@ -14,65 +19,111 @@ import models
 
 logger = logging.getLogger(__name__)
 
+# How many agency scrapers run at once (each is I/O-bound).
+_SCRAPE_WORKERS = int(os.getenv('SCRAPE_WORKERS', '6'))
+# Upserts sent to mongo per bulk_write round trip.
+_UPSERT_BATCH = 500
+
 # Try to import mongo collection; wrap in a local name so we can handle missing env/config gracefully
 try:
+	from pymongo import UpdateOne
+	from pymongo.errors import BulkWriteError
+	from util.slug import generate_unique_slug as _gen_slug
 	from util import mongo as _mongo_module
 	_BRONZE_COLLECTION = getattr(_mongo_module, 'bronze_links', None)
-	from util.slug import generate_unique_slug as _gen_slug
 except Exception:
 	_BRONZE_COLLECTION = None
 
 
+# path -> (mtime, module) for scrapers already imported by this process.
+_MODULE_CACHE: Dict[str, Tuple[float, ModuleType]] = {}
+
+
 def _discover_scrapers(scrape_dir: str) -> List[str]:
 	"""Return list of absolute python file paths in `scrape_dir` to consider as scrapers."""
 	files = []
-	if not os.path.isdir(scrape_dir):
+	try:
+		# scandir entries carry the file type from the directory read, so no per-file stat.
+		with os.scandir(scrape_dir) as it:
+			for entry in it:
+				name = entry.name
+				if not name.endswith('.py'):
+					continue
+				if name.startswith('_'):
+					continue
+				if name == '__init__.py':
+					continue
+				if not entry.is_file():
+					continue
+				files.append(entry.path)
+	except (FileNotFoundError, NotADirectoryError):
 		return files
-	for name in os.listdir(scrape_dir):
-		if not name.endswith('.py'):
-			continue
-		if name.startswith('_'):
-			continue
-		if name == '__init__.py':
-			continue
-		files.append(os.path.join(scrape_dir, name))
 	return sorted(files)
 
 
 def _load_module_from_path(path: str, module_name: str):
+	"""Import the file at `path`, reusing the module from an earlier call if the file is unchanged."""
+	mtime = os.path.getmtime(path)
+	cached = _MODULE_CACHE.get(path)
+	if cached is not None and cached[0] == mtime:
+		return cached[1]
 	spec = importlib.util.spec_from_file_location(module_name, path)
 	if spec is None or spec.loader is None:
 		raise ImportError(f"Cannot load module from {path}")
 	module = importlib.util.module_from_spec(spec)
-	spec.loader.exec_module(module)
+	sys.modules[module_name] = module
+	try:
+		spec.loader.exec_module(module)
+	except BaseException:
+		sys.modules.pop(module_name, None)
+		raise
+	_MODULE_CACHE[path] = (mtime, module)
 	return module
 
 
 def merge_link_results(results: List[models.LinkAggregationResult]) -> models.LinkAggregationResult:
-	# Collect all articles
-	all_articles = []
+	# Deduplicate by link in a single pass over all results, keeping the newest date
+	by_link = {}
 	for r in results:
-		if r is None:
+		if r is None or not hasattr(r, 'articles'):
 			continue
-		if hasattr(r, 'articles'):
-			all_articles.extend(r.articles)
-
-	# Deduplicate by link, keeping the newest date
-	by_link = {}
-	for a in all_articles:
-		existing = by_link.get(a.link)
-		if existing is None or a.date > existing.date:
-			by_link[a.link] = a
+		for a in r.articles:
+			existing = by_link.get(a.link)
+			if existing is None or a.date > existing.date:
+				by_link[a.link] = a
 
-	merged = list(by_link.values())
-	merged.sort(key=lambda x: x.date, reverse=True)
+	merged = sorted(by_link.values(), key=attrgetter('date'), reverse=True)
 	return models.LinkAggregationResult(articles=merged)
 
 
+def _run_scraper(path: str, scrape_fn, date: datetime.date):
+	"""Call one module's scrape(date) and normalize its return value; None on failure."""
+	try:
+		logger.info(f"Running scrape() from {path}")
+		res = scrape_fn(date)
+		# If the scraper returned a LinkAggregationStep (or list of steps), try to convert
+		if isinstance(res, models.LinkAggregationResult):
+			return res
+		elif hasattr(res, 'articles'):
+			# Accept any object with 'articles' attribute
+			return models.LinkAggregationResult(articles=list(res.articles))
+		elif isinstance(res, list):
+			# Possibly a list of LinkAggregationStep
+			try:
+				return models.LinkAggregationResult.from_steps(res)
+			except Exception:
+				logger.exception("Failed to convert list result to LinkAggregationResult")
+		else:
+			logger.warning(f"scrape() from {path} returned unexpected type: {type(res)}")
+	except Exception as e:
+		logger.exception(f"Error running scrape() from {path}: {e}")
+	return None
+
+
 def run_all(date: datetime.date) -> models.LinkAggregationResult:
 	scrape_dir = os.path.join(_HERE, 'scrape')
 	files = _discover_scrapers(scrape_dir)
-	results = []
+	jobs = []
 	for i, path in enumerate(files):
 		module_name = f"scrape_module_{i}_{os.path.splitext(os.path.basename(path))[0]}"
 		try:
@@ -86,31 +137,38 @@ def run_all(date: datetime.date) -> models.LinkAggregationResult:
 		if not callable(scrape_fn):
 			logger.info(f"Module {path} has no callable 'scrape' function, skipping")
 			continue
+		# Scrapers that can skip already-stored links take the collection as a
+		# keyword instead of importing util.mongo themselves.
+		if 'collection' in inspect.signature(scrape_fn).parameters:
+			scrape_fn = partial(scrape_fn, collection=_BRONZE_COLLECTION)
+		jobs.append((path, scrape_fn))
 
-		try:
-			logger.info(f"Running scrape() from {path}")
-			res = scrape_fn(date)
-			# If the scraper returned a LinkAggregationStep (or list of steps), try to convert
-			if isinstance(res, models.LinkAggregationResult):
-				results.append(res)
-			elif hasattr(res, 'articles'):
-				# Accept any object with 'articles' attribute
-				results.append(models.LinkAggregationResult(articles=list(res.articles)))
-			elif isinstance(res, list):
-				# Possibly a list of LinkAggregationStep
-				try:
-					results.append(models.LinkAggregationResult.from_steps(res))
-				except Exception:
-					logger.exception("Failed to convert list result to LinkAggregationResult")
-			else:
-				logger.warning(f"scrape() from {path} returned unexpected type: {type(res)}")
-		except Exception as e:
-			logger.exception(f"Error running scrape() from {path}: {e}")
+	# Scrapers hit different sites and spend nearly all their time waiting on
+	# the network, so run them side by side; results keep discovery order.
+	results = []
+	if jobs:
+		with ThreadPoolExecutor(max_workers=max(1, min(_SCRAPE_WORKERS, len(jobs)))) as pool:
+			results = list(pool.map(lambda job: _run_scraper(job[0], job[1], date), jobs))
 
 	merged = merge_link_results(results)
 	return merged
 
 
+def _to_mongo_doc(a: models.ArticleLink) -> dict:
+	"""Build the bronze_links document for an article, with its date as a datetime for Mongo."""
+	d = a.date
+	if isinstance(d, datetime.date) and not isinstance(d, datetime.datetime):
+		d = datetime.datetime.combine(d, datetime.time())
+	return {
+		'title': a.title,
+		'date': d,
+		'link': a.link,
+		'tags': list(a.tags),
+		'raw_content': a.raw_content,
+		'process_posturing': a.process_posturing,
+	}
+
+
 def _parse_date_arg(arg: str) -> datetime.date:
 	try:
 		return datetime.datetime.strptime(arg, '%Y-%m-%d').date()
@@ -135,45 +193,75 @@ def main(argv=None):
 		try:
 			inserted = 0
 			updated = 0
-			for a in combined.articles:
-				# Convert ArticleLink to dict and normalize date to datetime
-				doc = a.dict()
+			# Most links on a repeat run are already stored; look them all up in one
+			# round trip instead of paying a slug lookup plus an upsert for each.
+			known = set()
+			try:
+				links = [a.link for a in combined.articles]
+				if links:
+					known = set(_BRONZE_COLLECTION.distinct('link', {'link': {'$in': links}}))
+			except Exception:
+				logger.exception("Failed to look up existing links; upserting all")
+			skipped = 0
+			ops = []
+			pending_slugs = set()
+
+			def _flush():
+				nonlocal inserted, updated
+				if not ops:
+					return
 				try:
-					# Convert date (datetime.date) to datetime for Mongo
-					if isinstance(doc.get('date'), datetime.date):
-						doc['date'] = datetime.datetime.combine(doc['date'], datetime.time())
+					res = _BRONZE_COLLECTION.bulk_write(ops, ordered=False)
+					inserted += res.upserted_count
+					updated += res.matched_count
+				except BulkWriteError as e:
+					details = e.details or {}
+					inserted += details.get('nUpserted', 0)
+					updated += details.get('nMatched', 0)
+					for err in details.get('writeErrors', []):
+						logger.error(f"Failed to upsert document for link {err.get('op', {}).get('q', {}).get('link')}: {err.get('errmsg')}")
 				except Exception:
-					# leave as-is if conversion fails
-					pass
+					logger.exception(f"Failed to upsert batch of {len(ops)} documents")
+				ops.clear()
+				pending_slugs.clear()
+
+			for a in combined.articles:
+				if a.link in known:
+					skipped += 1
+					continue
+				doc = _to_mongo_doc(a)
 
 				# Ensure a unique slug for the article (based on title)
 				try:
-					art_date = None
-					try:
-						if isinstance(doc.get('date'), datetime.datetime):
-							art_date = doc['date'].date()
-					except Exception:
-						art_date = None
-					doc['slug'] = _gen_slug(_BRONZE_COLLECTION, doc.get('title', '') or doc.get('link', ''), date=art_date)
+					art_date = a.date if isinstance(a.date, datetime.date) else None
+					base_text = doc.get('title', '') or doc.get('link', '')
+					slug = _gen_slug(_BRONZE_COLLECTION, base_text, date=art_date)
+					if slug in pending_slugs:
+						# Another queued doc claimed this slug; write the batch so the lookup sees it.
+						_flush()
+						slug = _gen_slug(_BRONZE_COLLECTION, base_text, date=art_date)
+					doc['slug'] = slug
+					pending_slugs.add(slug)
 				except Exception:
 					# If slug generation fails, skip setting it
 					pass
 
+				set_on_insert = {'inserted_at': datetime.datetime.utcnow()}
+				if not doc['raw_content']:
+					# Never blank out a body already stored for this link.
+					set_on_insert['raw_content'] = doc.pop('raw_content')
+
 				# Upsert by link
-				try:
-					res = _BRONZE_COLLECTION.update_one(
-						{'link': doc.get('link')},
-						{'$set': doc, '$setOnInsert': {'inserted_at': datetime.datetime.utcnow()}},
-						upsert=True,
-					)
-					if getattr(res, 'upserted_id', None) is not None:
-						inserted += 1
-					else:
-						updated += 1
-				except Exception:
-					logger.exception(f"Failed to upsert document for link {doc.get('link')}")
+				ops.append(UpdateOne(
+					{'link': doc.get('link')},
+					{'$set': doc, '$setOnInsert': set_on_insert},
+					upsert=True,
+				))
+				if len(ops) >= _UPSERT_BATCH:
+					_flush()
+			_flush()
 
-			print(f"Mongo: inserted={inserted}, updated={updated}")
+			print(f"Mongo: inserted={inserted}, updated={updated}, skipped={skipped}")
 		except Exception:
 			logger.exception("Error while saving to mongo")
 	else:
@@ -1,5 +1,6 @@
 from enum import Enum
 import os
+import re
 import sys
 from typing import Any, List, Tuple, Optional
 from dotenv import load_dotenv
@@ -7,10 +8,13 @@ import datetime
 import json
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 
 
 import pymongo
+from pymongo.errors import BulkWriteError
 from bson import ObjectId
 
 _HERE = os.path.dirname(__file__)
@@ -35,6 +39,9 @@ except Exception:
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# How many claims are sent to run_with_search at once (each call is I/O-bound).
+_LLM_CONCURRENCY = int(os.getenv('LLM_CONCURRENCY', '8'))
+
 
 def _pipeline_day_bounds(d: datetime.date) -> Tuple[datetime.datetime, datetime.datetime]:
     """Return start (inclusive) and end (exclusive) datetimes for the given pipeline date
@@ -109,6 +116,55 @@ def _is_terminal_verdict(v: Optional[str]) -> bool:
         return True
     return False
 
+# Set STRICT_VALIDATION=1 to run full MongoClaim validation on every DB row (debugging).
+_STRICT_VALIDATION = bool(os.getenv('STRICT_VALIDATION'))
+_CLAIM_FIELDS = tuple(getattr(MongoClaim, 'model_fields', {}))
+_CLAIM_REQUIRED = tuple(k for k, f in getattr(MongoClaim, 'model_fields', {}).items() if f.is_required())
+
+
+# Only the claim fields the update pipeline reads (skips lm_log and other bulky extras).
+_CLAIM_PROJECTION = {k: 1 for k in (
+    '_id', 'type', 'claim', 'verbatim_claim', 'completion_condition', 'completion_condition_date',
+    'event_date', 'article_date', 'article_id', 'article_link', 'date_past', 'follow_up_worthy',
+)}
+
+
+def _coerce_claim_date(v: Any) -> Any:
+    """Mirror MongoClaim's date validators: datetime/ISO string -> date, Date_Delta -> resolved date."""
+    if isinstance(v, datetime.datetime):
+        return v.date()
+    if isinstance(v, str):
+        s = v.strip()
+        try:
+            return datetime.datetime.fromisoformat(s).date()
+        except ValueError:
+            try:
+                return datetime.date.fromisoformat(s)
+            except ValueError:
+                return v
+    if isinstance(v, dict):
+        v = Date_Delta(**v)
+    if isinstance(v, Date_Delta):
+        return v._resolve_date()
+    return v
+
+
+def _fast_claim(raw: dict) -> MongoClaim:
+    """Build a MongoClaim from a silver_claims row without full pydantic validation.
+
+    These rows were written by this pipeline through MongoClaim already, so only the
+    date coercions downstream code relies on are redone. Rows missing a required
+    field still go through the validating constructor so they fail loudly.
+    """
+    if _STRICT_VALIDATION or not _CLAIM_FIELDS or any(k not in raw for k in _CLAIM_REQUIRED):
+        return MongoClaim(**raw)
+    values = {k: raw[k] for k in _CLAIM_FIELDS if k in raw}
+    for k in ('article_date', 'completion_condition_date', 'event_date'):
+        if values.get(k) is not None:
+            values[k] = _coerce_claim_date(values[k])
+    return MongoClaim.model_construct(**values)
+
+
 def get_claim_groups() -> Tuple[List[Tuple[Any, MongoClaim]], List[Tuple[Any, MongoClaim]], List[Tuple[Any, MongoClaim]]]:
     """Return (promises, goals_fu, statements_fu) groups.
 
@@ -121,15 +177,15 @@ def get_claim_groups() -> Tuple[List[Tuple[Any, MongoClaim]], List[Tuple[Any, Mo
             {'$or': [{'date_past': False}, {'date_past': {'$exists': False}}]},
             {'type': 'promise'},
         ]
-    })
-    goals_cur = mongo.silver_claims.find({'type': 'goal', 'follow_up_worthy': True})
-    statements_cur = mongo.silver_claims.find({'type': 'statement', 'follow_up_worthy': True})
+    }, _CLAIM_PROJECTION)
+    goals_cur = mongo.silver_claims.find({'type': 'goal', 'follow_up_worthy': True}, _CLAIM_PROJECTION)
+    statements_cur = mongo.silver_claims.find({'type': 'statement', 'follow_up_worthy': True}, _CLAIM_PROJECTION)
 
     def _collect(cur):
         out: List[Tuple[Any, MongoClaim]] = []
         for raw in cur:
             try:
-                out.append((raw, MongoClaim(**raw)))
+                out.append((raw, _fast_claim(raw)))
             except Exception:
                 logger.exception(f'Invalid MongoClaim in DB: {raw.get("_id")}')
         return out
@@ -169,18 +225,52 @@ def get_article_from_id(article_id: str) -> MongoArticle:
     return MongoArticle(**article)
     
 
-def _build_requests(claim_pairs: List[Tuple[Any, MongoClaim]], regular_tpl: str, endpoint_tpl: str, model: Optional[str] = None):
+# User-message bodies for the check-in requests; the prompt template goes in as the system message.
+_CLAIM_PROMPT_FMT = (
+    "-- Article Metadata --\n"
+    "Source Article Link: {link}\n"
+    "Source Article Date: {adate}\n"
+    "Claim: {claim}\n"
+    "Verbatim Quote from Article: {quote}\n"
+    "Completion Condition: {cond}\n"
+    "Projected Completion Date: {cond_date}\n"
+    "Current Date: {today}"
+)
+_STATEMENT_PROMPT_FMT = (
+    "-- Statement Metadata --\n"
+    "Source Article Link: {link}\n"
+    "Source Article Date: {adate}\n"
+    "Claim (statement): {claim}\n"
+    "Verbatim Quote: {quote}\n"
+    "{event}"
+    "Current Date: {today}"
+)
+_FOLLOWUP_PROMPT_FMT = (
+    "-- Followup Metadata --\n"
+    "Source Article Link: {link}\n"
+    "Source Article Date: {adate}\n"
+    "Claim: {claim}\n"
+    "Followup requested for: {fu_date}"
+)
+
+
+def _build_requests(claim_pairs: List[Tuple[Any, MongoClaim]], regular_tpl: str, endpoint_tpl: str, model: Optional[str] = None, today: Optional[datetime.date] = None):
     """Build a list of request descriptors for in-house web search pipeline.
 
     claim_pairs: iterable of (raw_doc, MongoClaim)
+    today: pipeline date (fixed UTC-5); resolved once here when not given
     Each request contains: {custom_id, model, input}
     """
     model = model or os.environ.get('OPENAI_MODEL', 'gpt-5-nano')
+    if today is None:
+        today = _get_pipeline_today()
+    regular_tpl = regular_tpl.strip()
+    endpoint_tpl = endpoint_tpl.strip()
     requests = []
     mapping = {}
     for idx, (raw, claim) in enumerate(claim_pairs):
         try:
-            update_type = claim_needs_update(claim)
+            update_type = claim_needs_update(claim, today)
         except Exception:
             logger.exception('Failed to determine update type for claim; skipping')
             continue
@@ -205,10 +295,9 @@ def _build_requests(claim_pairs: List[Tuple[Any, MongoClaim]], regular_tpl: str,
 
         # Gate: only one update per claim per pipeline date
         try:
-            _today_for_gate = _get_pipeline_today()
-            if _has_update_on_date(claim_id, _today_for_gate):
+            if _has_update_on_date(claim_id, today):
                 # Also invalidate any same-day scheduled followups for this claim
-                invalidated = _invalidate_followups_for_day(claim_id, _today_for_gate)
+                invalidated = _invalidate_followups_for_day(claim_id, today)
                 if invalidated:
                     logger.info('Invalidated %d same-day followups for claim %s due to existing update today', invalidated, claim_id)
                 logger.info('Skipping scheduled update for claim %s; already updated today', claim_id)
@@ -216,29 +305,22 @@ def _build_requests(claim_pairs: List[Tuple[Any, MongoClaim]], regular_tpl: str,
         except Exception:
             pass
 
-        content_parts = ["-- Article Metadata --"]
-        content_parts.append(f"Source Article Link: {getattr(claim, 'article_link', '')}")
-        content_parts.append(f"Source Article Date: {article_date_str}")
-        content_parts.append(f"Claim: {getattr(claim, 'claim', '')}")
-        content_parts.append(f"Verbatim Quote from Article: {getattr(claim, 'verbatim_claim', '')}")
-        content_parts.append(f"Completion Condition: {getattr(claim, 'completion_condition', '')}")
-        content_parts.append(f"Projected Completion Date: {getattr(claim, 'completion_condition_date', '')}")
-        # Use pipeline 'today' (fixed UTC-5) for consistency
-        try:
-            from util.timezone import pipeline_today as _pt
-            _today = _pt()
-        except Exception:
-            _today = _get_pipeline_today()
-        content_parts.append(f"Current Date: {_today}")
-
-        content = "\n".join(content_parts)
+        content = _CLAIM_PROMPT_FMT.format(
+            link=getattr(claim, 'article_link', ''),
+            adate=article_date_str,
+            claim=getattr(claim, 'claim', ''),
+            quote=getattr(claim, 'verbatim_claim', ''),
+            cond=getattr(claim, 'completion_condition', ''),
+            cond_date=getattr(claim, 'completion_condition_date', ''),
+            today=today,
+        )
 
         req = {
             "custom_id": str(custom_id),
             "model": model_for_req,
             "effort": effort_for_req,
             "input": content,
-            "system": tpl.strip(),
+            "system": tpl,
         }
         requests.append(req)
         mapping[str(custom_id)] = (raw, claim, update_type)
@@ -252,24 +334,57 @@ def _build_requests(claim_pairs: List[Tuple[Any, MongoClaim]], regular_tpl: str,
 # Legacy OpenAI helper code removed — we now use run_with_search with structured outputs.
 
 
+# Keyword groups for _classify_verdict, checked in this priority order (substring matches).
+_VERDICT_PATTERNS = (
+    (re.compile('complete|fulfilled|succeeded|met'), 'complete'),
+    (re.compile('progress|ongoing'), 'in_progress'),
+    (re.compile('fail|not met|not fulfilled|did not'), 'failed'),
+)
+
+
 def _classify_verdict(text: str) -> str:
     t = (text or '').lower()
-    if any(k in t for k in ('complete', 'fulfilled', 'succeeded', 'met')):
-        return 'complete'
-    if any(k in t for k in ('in progress', 'in_progress', 'progress', 'ongoing')):
-        return 'in_progress'
-    if any(k in t for k in ('fail', 'failed', 'not met', 'not fulfilled', 'did not')):
-        return 'failed'
+    for pattern, verdict in _VERDICT_PATTERNS:
+        if pattern.search(t):
+            return verdict
     return 'in_progress'
 
 
+@lru_cache(maxsize=4096)
+def _coerce_date_str(s: str) -> Optional[datetime.date]:
+    # Cached: model outputs repeat the same handful of follow-up dates across claims.
+    try:
+        return datetime.date.fromisoformat(s)
+    except Exception:
+        try:
+            return datetime.datetime.fromisoformat(s.replace('Z', '+00:00')).date()
+        except Exception:
+            for fmt in ("%B %d, %Y", "%Y-%m-%d", "%m/%d/%Y"):
+                try:
+                    return datetime.datetime.strptime(s, fmt).date()
+                except Exception:
+                    continue
+    return None
+
+
+def _coerce_date(val):
+    if val is None:
+        return None
+    if isinstance(val, datetime.date):
+        return val
+    if isinstance(val, str):
+        return _coerce_date_str(val.strip())
+    return None
+
+
 class UpdateType(Enum):
     ENDPOINT = 1
     REGULAR_INTERVAL = 2
     NO_UPDATE = 3
 
-def claim_needs_update(claim: MongoClaim) -> UpdateType:
-    today = _get_pipeline_today()
+def claim_needs_update(claim: MongoClaim, today: Optional[datetime.date] = None) -> UpdateType:
+    if today is None:
+        today = _get_pipeline_today()
     if isinstance(claim.completion_condition_date, Date_Delta):
         claim.completion_condition_date = claim.completion_condition_date._resolve_date()
     assert isinstance(claim.completion_condition_date, datetime.date), f'Unexpected date type: {type(claim.completion_condition_date)} - {claim.completion_condition_date}'
@@ -280,12 +395,10 @@ def claim_needs_update(claim: MongoClaim) -> UpdateType:
     
     timespan = claim.completion_condition_date - claim.article_date
     if timespan.days > 90:
-        # 30 day interval
-        update_date = claim.article_date + datetime.timedelta(days=30)
-        while update_date < today:
-            update_date += datetime.timedelta(days=30)
-            if update_date == today:
-                return UpdateType.REGULAR_INTERVAL
+        # 30 day interval: due on every 30-day boundary from the second one on
+        elapsed = (today - claim.article_date).days
+        if elapsed >= 60 and elapsed % 30 == 0:
+            return UpdateType.REGULAR_INTERVAL
         return UpdateType.NO_UPDATE
     elif timespan.days <= 14:
         # Only at the end
@@ -321,10 +434,9 @@ def next_update_date(claim: MongoClaim, today: datetime.date) -> Optional[dateti
 
     # Monthly cadence for long windows
     if timespan.days > 90:
-        # First 30-day boundary strictly after today (or on today if exact)
-        step = claim.article_date + datetime.timedelta(days=30)
-        while step <= today:
-            step += datetime.timedelta(days=30)
+        # First 30-day boundary strictly after today
+        periods = max(1, (today - claim.article_date).days // 30 + 1)
+        step = claim.article_date + datetime.timedelta(days=30 * periods)
         # Do not schedule beyond completion; use endpoint on completion date
         return step if step <= completion else completion
 
@@ -362,10 +474,8 @@ def compute_followup_schedule(claim: MongoClaim) -> List[datetime.date]:
     schedule: List[datetime.date] = []
 
     if timespan.days > 90:
-        step = start + datetime.timedelta(days=30)
-        while step < completion:
-            schedule.append(step)
-            step += datetime.timedelta(days=30)
+        # Every 30-day boundary strictly before completion
+        schedule = [start + datetime.timedelta(days=30 * i) for i in range(1, (timespan.days - 1) // 30 + 1)]
         schedule.append(completion)
         if len(schedule) > 2 and schedule[-1] - schedule[-2] < datetime.timedelta(days=5):
             # If the last update is close enough to the final date, we can accept a slightly longer window.
@@ -381,11 +491,29 @@ def compute_followup_schedule(claim: MongoClaim) -> List[datetime.date]:
 
     return schedule
 
-def ensure_full_schedule_for_claim(raw: Any, claim: MongoClaim, today: datetime.date, db) -> int:
+_FOLLOWUP_INDEX_READY = False
+
+
+def _ensure_followup_index(followups_coll) -> None:
+    """Create the unique (claim_id, follow_up_date) index on silver_followups once per process."""
+    global _FOLLOWUP_INDEX_READY
+    if _FOLLOWUP_INDEX_READY:
+        return
+    _FOLLOWUP_INDEX_READY = True
+    try:
+        followups_coll.create_index([('claim_id', 1), ('follow_up_date', 1)], unique=True)
+    except Exception:
+        # Existing duplicates block a unique index; run dedupe_followups.py to clear them.
+        logger.warning('Could not create unique (claim_id, follow_up_date) index on silver_followups', exc_info=True)
+
+
+def ensure_full_schedule_for_claim(raw: Any, claim: MongoClaim, today: datetime.date, db, already_scheduled: Optional[set] = None) -> int:
     """Insert the full future follow-up schedule for a claim if none are scheduled yet.
 
     - Only inserts dates >= `today`.
     - If any future follow-up already exists (on or after `today`), does nothing.
+      `already_scheduled` (claim ids known to have one) answers that locally; without it
+      the collection is queried.
     - Returns the number of follow-ups inserted.
     """
     try:
@@ -408,17 +536,21 @@ def ensure_full_schedule_for_claim(raw: Any, claim: MongoClaim, today: datetime.
         return 0
 
     # If any future followup already exists, skip scheduling
-    try:
-        filter_q = { 'claim_id': raw.get('_id'), 'follow_up_date': { '$gte': today } }
+    if already_scheduled is not None:
+        if raw.get('_id') in already_scheduled:
+            return 0
+    else:
         try:
-            filter_q = mongo.normalize_dates(filter_q)
+            filter_q = { 'claim_id': raw.get('_id'), 'follow_up_date': { '$gte': today } }
+            try:
+                filter_q = mongo.normalize_dates(filter_q)
+            except Exception:
+                logger.exception('normalize_dates failed for future-followup existence check; using raw filter')
+            if followups_coll.count_documents(filter_q, limit=1) > 0:
+                return 0
         except Exception:
-            logger.exception('normalize_dates failed for future-followup existence check; using raw filter')
-        if followups_coll.count_documents(filter_q, limit=1) > 0:
-            return 0
-    except Exception:
-        logger.exception('Failed checking existing future followups for claim %s', raw.get('_id'))
-        # If in doubt, continue to attempt scheduling rather than silently skipping
+            logger.exception('Failed checking existing future followups for claim %s', raw.get('_id'))
+            # If in doubt, continue to attempt scheduling rather than silently skipping
 
     # Build full schedule and filter to future
     try:
@@ -431,7 +563,7 @@ def ensure_full_schedule_for_claim(raw: Any, claim: MongoClaim, today: datetime.
     if not future_dates:
         return 0
 
-    inserted = 0
+    docs = []
     for d in future_dates:
         follow_doc = {
             'claim_id': raw.get('_id'),
@@ -442,34 +574,43 @@ def ensure_full_schedule_for_claim(raw: Any, claim: MongoClaim, today: datetime.
             'model_output': f'Scheduled full plan on {today.isoformat()} (autoplan)',
             'created_at': datetime.datetime.utcnow(),
         }
+        # Built from our own fields above, so it already matches SilverFollowup's dumped shape.
+        final_follow = {**follow_doc, 'lm_log': None, 'processed_at': None, 'processed_update_id': None}
         try:
-            follow_obj = SilverFollowup(**follow_doc)
-            final_follow = follow_obj.model_dump() if hasattr(follow_obj, 'model_dump') else follow_obj.dict()
-            try:
-                final_follow = mongo.normalize_dates(final_follow)
-            except Exception:
-                logger.exception('Failed to normalize dates for autoplan silver_followup; inserting raw doc')
-            # Deduplicate by (claim_id, follow_up_date)
-            try:
-                if followups_coll.count_documents({ 'claim_id': final_follow.get('claim_id'), 'follow_up_date': final_follow.get('follow_up_date') }, limit=1) == 0:
-                    followups_coll.insert_one(final_follow)
-                    inserted += 1
-            except Exception:
-                followups_coll.insert_one(final_follow)
-                inserted += 1
+            final_follow = mongo.normalize_dates(final_follow)
         except Exception:
-            logger.exception('Failed inserting autoplan followup for claim %s on %s', raw.get('_id'), d)
+            logger.exception('Failed to normalize dates for autoplan silver_followup; inserting raw doc')
+        docs.append(final_follow)
 
-    return inserted
+    if not docs:
+        return 0
+    # No followup exists on/after `today` (checked above), so every date here is new; the
+    # unique (claim_id, follow_up_date) index rejects any that race in between.
+    _ensure_followup_index(followups_coll)
+    try:
+        res = followups_coll.insert_many(docs, ordered=False)
+        return len(res.inserted_ids)
+    except BulkWriteError as e:
+        errors = (e.details or {}).get('writeErrors', [])
+        dupes = sum(1 for err in errors if err.get('code') == 11000)
+        if dupes != len(errors):
+            logger.error('Failed inserting %d autoplan followups for claim %s', len(errors) - dupes, raw.get('_id'))
+        return (e.details or {}).get('nInserted', 0)
+    except Exception:
+        logger.exception('Failed inserting autoplan followups for claim %s', raw.get('_id'))
+        return 0
 
+@lru_cache(maxsize=None)
 def _checkin_template() -> str:
     tpl_path = os.path.join(_REPO_ROOT, 'prompts', 'regular_checkin.md')
     return load_prompt_with_values(tpl_path)
 
+@lru_cache(maxsize=None)
 def _endpoint_template() -> str:
     tpl_path = os.path.join(_REPO_ROOT, 'prompts', 'endpoint_checkin.md')
     return load_prompt_with_values(tpl_path)
 
+@lru_cache(maxsize=None)
 def _fact_check_template() -> str:
     tpl_path = os.path.join(_REPO_ROOT, 'prompts', 'fact_check.md')
     return load_prompt_with_values(tpl_path)
@@ -490,12 +631,14 @@ def main():
 
     # Build update requests per type
     promises, goals_fu, statements_fu = get_claim_groups()
-    regular_checkin_template = _checkin_template()
-    endpoint_checkin_template = _endpoint_template()
-    fact_check_template = _fact_check_template()
+    regular_checkin_template = _checkin_template().strip()
+    endpoint_checkin_template = _endpoint_template().strip()
+    fact_check_template = _fact_check_template().strip()
+    # Pipeline 'today' (fixed UTC-5), resolved once for every request built below
+    today = _get_pipeline_today()
 
     # Promises follow existing scheduling logic
-    request_lines, mapping = _build_requests(promises, regular_checkin_template, endpoint_checkin_template)
+    request_lines, mapping = _build_requests(promises, regular_checkin_template, endpoint_checkin_template, today=today)
 
     # Goals: follow same cadence template (regular/endpoint) but we do not gate on completion date logic;
     # include them for a regular check-in now so the model can propose next follow_up_date proactively.
@@ -506,27 +649,22 @@ def main():
         custom_id = f"goal:{claim_id}:{idx}"
         article_date = getattr(claim, 'article_date', None)
         article_date_str = str(article_date) if article_date is not None else ''
-        content_parts = ["-- Article Metadata --"]
-        content_parts.append(f"Source Article Link: {getattr(claim, 'article_link', '')}")
-        content_parts.append(f"Source Article Date: {article_date_str}")
-        content_parts.append(f"Claim: {getattr(claim, 'claim', '')}")
-        content_parts.append(f"Verbatim Quote from Article: {getattr(claim, 'verbatim_claim', '')}")
-        content_parts.append(f"Completion Condition: {getattr(claim, 'completion_condition', '')}")
-        content_parts.append(f"Projected Completion Date: {getattr(claim, 'completion_condition_date', '')}")
-        try:
-            from util.timezone import pipeline_today as _pt
-            _today = _pt()
-        except Exception:
-            _today = _get_pipeline_today()
-        content_parts.append(f"Current Date: {_today}")
-        content = "\n".join(content_parts)
+        content = _CLAIM_PROMPT_FMT.format(
+            link=getattr(claim, 'article_link', ''),
+            adate=article_date_str,
+            claim=getattr(claim, 'claim', ''),
+            quote=getattr(claim, 'verbatim_claim', ''),
+            cond=getattr(claim, 'completion_condition', ''),
+            cond_date=getattr(claim, 'completion_condition_date', ''),
+            today=today,
+        )
         req = {
             "custom_id": str(custom_id),
             # Goals: treat as regular check-ins → agent/low
             "model": MODEL_TABLE['agent']['low'][0],
             "effort": MODEL_TABLE['agent']['low'][1],
             "input": content,
-            "system": regular_checkin_template.strip(),
+            "system": regular_checkin_template,
         }
         goals_lines.append(req)
         goals_map[str(custom_id)] = (raw, claim, None)
@@ -542,17 +680,46 @@ def main():
     # Statements: do not revisit unless a follow-up date was given (handled by scheduled followups)
     # Therefore, only include statements that have never been fact-checked (no latest update)
     updates_coll = db.get_collection('silver_updates')
+    # Latest fact check per statement claim in one aggregation rather than a query per claim.
+    latest_by_claim = {}
+    try:
+        try:
+            updates_coll.create_index([('claim_id', 1), ('created_at', -1), ('_id', -1)])
+        except Exception:
+            logger.warning('Could not ensure (claim_id, created_at) index on silver_updates', exc_info=True)
+        stmt_ids = [raw.get('_id') for raw, _ in statements_fu]
+        if stmt_ids:
+            rows = updates_coll.aggregate([
+                {'$match': {'claim_id': {'$in': stmt_ids}}},
+                {'$sort': {'created_at': -1, '_id': -1}},
+                {'$group': {
+                    '_id': '$claim_id',
+                    'doc_id': {'$first': '$_id'},
+                    'verdict': {'$first': '$verdict'},
+                    'model_output': {'$first': '$model_output'},
+                }},
+            ])
+            latest_by_claim = {row['_id']: row for row in rows}
+    except Exception:
+        # e.g. an $in list too large for one command; fall back to a find_one per claim below
+        logger.exception('Failed to look up latest fact checks for statements; checking per claim')
+        latest_by_claim = None
     filtered_statements: List[Tuple[Any, MongoClaim]] = []
     for raw, claim in statements_fu:
         try:
-            latest = updates_coll.find(
-                { 'claim_id': raw.get('_id') }
-            ).sort([('created_at', -1), ('_id', -1)])
-            latest_list = list(latest)
-            if latest_list:
+            if latest_by_claim is not None:
+                last_doc = latest_by_claim.get(raw.get('_id'))
+            else:
+                last_doc = updates_coll.find_one(
+                    {'claim_id': raw.get('_id')},
+                    {'verdict': 1, 'model_output': 1},
+                    sort=[('created_at', -1), ('_id', -1)],
+                )
+                if last_doc is not None:
+                    last_doc['doc_id'] = last_doc.get('_id')
+            if last_doc is not None:
                 # If latest fact check's response object verdict is in_progress, delete it and re-run
                 try:
-                    last_doc = latest_list[0]
                     top_v = (last_doc.get('verdict') or '').strip().lower() if isinstance(last_doc.get('verdict'), str) else str(last_doc.get('verdict') or '').strip().lower()
                     mo = last_doc.get('model_output')
                     mo_v = ''
@@ -563,7 +730,7 @@ def main():
                     # Treat either top-level or response-object verdict as authoritative, or delete errored runs
                     if mo_is_error or mo_v == 'in_progress' or top_v == 'in_progress':
                         try:
-                            updates_coll.delete_one({ '_id': last_doc.get('_id') })
+                            updates_coll.delete_one({ '_id': last_doc.get('doc_id') })
                             if mo_is_error:
                                 logger.info('Deleted errored fact check update for claim %s; re-running', raw.get('_id'))
                             else:
@@ -593,24 +760,18 @@ def main():
         article_date_str = str(article_date) if article_date is not None else ''
         event_date = getattr(claim, 'event_date', None)
         event_date_str = str(event_date) if event_date is not None else ''
-        parts = ["-- Statement Metadata --"]
-        parts.append(f"Source Article Link: {getattr(claim, 'article_link', '')}")
-        parts.append(f"Source Article Date: {article_date_str}")
-        parts.append(f"Claim (statement): {getattr(claim, 'claim', '')}")
-        parts.append(f"Verbatim Quote: {getattr(claim, 'verbatim_claim', '')}")
-        if event_date_str:
-            parts.append(f"Event/Effective Date (if any): {event_date_str}")
-        try:
-            from util.timezone import pipeline_today as _pt
-            _today = _pt()
-        except Exception:
-            _today = _get_pipeline_today()
-        parts.append(f"Current Date: {_today}")
-        content = "\n".join(parts)
+        content = _STATEMENT_PROMPT_FMT.format(
+            link=getattr(claim, 'article_link', ''),
+            adate=article_date_str,
+            claim=getattr(claim, 'claim', ''),
+            quote=getattr(claim, 'verbatim_claim', ''),
+            event=f"Event/Effective Date (if any): {event_date_str}\n" if event_date_str else '',
+            today=today,
+        )
         req = {
             "custom_id": str(custom_id),
             "input": content,
-            "system": fact_check_template.strip(),
+            "system": fact_check_template,
         }
         stmt_lines.append(req)
         stmt_map[str(custom_id)] = (raw, claim, None)
@@ -619,7 +780,7 @@ def main():
     mapping.update(stmt_map)
 
     # Also include any scheduled followups for today's pipeline date from `silver_followups`.
-    pipeline_today = _get_pipeline_today()
+    pipeline_today = today
 
     # Ensure DB is available before querying followups
     db = getattr(mongo, 'DB', None)
@@ -629,10 +790,24 @@ def main():
 
     # Ensure a one-time full schedule is present for each promise with no upcoming followups.
     autoplan_inserted = 0
+    # One query for which promises already have an upcoming followup, instead of one per promise.
+    already_scheduled = None
+    try:
+        promise_ids = [raw.get('_id') for raw, _ in promises]
+        if promise_ids:
+            q = {'claim_id': {'$in': promise_ids}, 'follow_up_date': {'$gte': pipeline_today}}
+            try:
+                q = mongo.normalize_dates(q)
+            except Exception:
+                logger.exception('normalize_dates failed for scheduled-followup lookup; using raw filter')
+            already_scheduled = set(db.get_collection('silver_followups').distinct('claim_id', q))
+    except Exception:
+        logger.exception('Failed looking up promises with upcoming followups; checking per claim')
+        already_scheduled = None
     try:
         for raw, claim in promises:
             try:
-                inserted = ensure_full_schedule_for_claim(raw, claim, pipeline_today, db)
+                inserted = ensure_full_schedule_for_claim(raw, claim, pipeline_today, db, already_scheduled)
                 autoplan_inserted += inserted
             except Exception:
                 logger.exception('Autoplan scheduling failed for claim %s', raw.get('_id'))
@@ -684,17 +859,17 @@ def main():
                     continue
             except Exception:
                 pass
-            content_parts = ["-- Followup Metadata --"]
-            content_parts.append(f"Source Article Link: {f.get('article_link', '')}")
-            content_parts.append(f"Source Article Date: {str(f.get('article_date', ''))}")
-            content_parts.append(f"Claim: {f.get('claim_text', '')}")
-            content_parts.append(f"Followup requested for: {str(f.get('follow_up_date', ''))}")
-            content = "\n".join(content_parts)
+            content = _FOLLOWUP_PROMPT_FMT.format(
+                link=f.get('article_link', ''),
+                adate=f.get('article_date', ''),
+                claim=f.get('claim_text', ''),
+                fu_date=f.get('follow_up_date', ''),
+            )
 
             req = {
                 'custom_id': str(custom_id),
                 'input': content,
-                'system': endpoint_checkin_template.strip(),
+                'system': endpoint_checkin_template,
             }
             request_lines.append(req)
             # Mark mapping entry specially so processing loop knows this is a followup
@@ -713,18 +888,17 @@ def main():
     # Call run_with_search for each request and insert results directly
     silver = db.get_collection('silver_updates')
 
-    inserted = 0
-
-    for req in request_lines:
+    def _process_request(req) -> int:
+        """Run one request through run_with_search and store its update; returns 1 if inserted."""
         custom_id = req.get('custom_id')
         if not custom_id:
             logger.warning('Skipping request with no custom_id')
-            continue
+            return 0
 
         mapping_entry = mapping.get(str(custom_id))
         if not mapping_entry:
             logger.warning(f'No mapping for custom_id {custom_id}; skipping')
-            continue
+            return 0
 
         # mapping_entry is usually (raw, claim, update_type), but followups are ('_followup', followup_doc)
         is_followup = False
@@ -737,7 +911,7 @@ def main():
                 update_type = None
             except Exception:
                 logger.exception('Unexpected mapping_entry shape for custom_id %s: %s', custom_id, mapping_entry)
-                continue
+                return 0
 
         if isinstance(raw, str) and raw == '_followup':
             is_followup = True
@@ -776,7 +950,7 @@ def main():
                     except Exception:
                         logger.exception('Failed invalidating followups during execution-time gate')
                 # Skip to next request without calling the model
-                continue
+                return 0
         except Exception:
             pass
         try:
@@ -846,29 +1020,6 @@ def main():
             model_text = 'error calling run_with_search'
             verdict = 'Tech Error'
 
-        def _coerce_date(val):
-            if val is None:
-                return None
-            if isinstance(val, datetime.date):
-                return val
-            if isinstance(val, datetime.datetime):
-                return val.date()
-            if isinstance(val, str):
-                s = val.strip()
-                try:
-                    return datetime.date.fromisoformat(s)
-                except Exception:
-                    try:
-                        return datetime.datetime.fromisoformat(s.replace('Z', '+00:00')).date()
-                    except Exception:
-                        for fmt in ("%B %d, %Y", "%Y-%m-%d", "%m/%d/%Y"):
-                            try:
-                                return datetime.datetime.strptime(s, fmt).date()
-                            except Exception:
-                                continue
-                return None
-            return None
-
         follow_date_raw = None
         if parsed_obj is not None:
             follow_date_raw = getattr(parsed_obj, 'follow_up_date', None) if hasattr(parsed_obj, 'follow_up_date') else (parsed_obj.get('follow_up_date') if isinstance(parsed_obj, dict) else None)
@@ -990,20 +1141,21 @@ def main():
             silver_obj = SilverUpdate(**doc)
         except Exception:
             logger.exception(f'Failed to construct SilverUpdate for claim {doc.get("claim_id")} ; doc={doc}')
-            continue
+            return 0
 
         if hasattr(silver_obj, 'model_dump'):
             final_doc = silver_obj.model_dump()
         else:
             final_doc = silver_obj.dict()
 
+        stored = 0
         try:
             try:
                 final_doc = mongo.normalize_dates(final_doc)
             except Exception:
                 logger.exception('Failed to normalize dates for silver_update; proceeding with original doc')
             insert_res = silver.insert_one(final_doc)
-            inserted += 1
+            stored = 1
         except Exception:
             logger.exception('Failed to insert into silver_updates')
             insert_res = None
@@ -1038,6 +1190,35 @@ def main():
                         logger.exception('Failed to invalidate same-day followups after update insertion')
             except Exception:
                 logger.exception('Error while post-processing followup mapping entry')
+        return stored
+
+    # Requests for the same claim run one after another so the same-day gate sees
+    # the previous update; different claims overlap their LLM/web-search round trips.
+    by_claim = {}
+    for req in request_lines:
+        entry = mapping.get(str(req.get('custom_id')))
+        key = req.get('custom_id')
+        try:
+            if entry and entry[0] == '_followup':
+                key = entry[1].get('claim_id')
+            elif entry:
+                key = entry[0].get('_id')
+        except Exception:
+            pass
+        by_claim.setdefault(str(key), []).append(req)
+
+    def _process_group(reqs) -> int:
+        n = 0
+        for req in reqs:
+            try:
+                n += _process_request(req)
+            except Exception:
+                logger.exception('Unexpected error processing request %s', req.get('custom_id'))
+        return n
+
+    workers = max(1, min(_LLM_CONCURRENCY, len(by_claim)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        inserted = sum(pool.map(_process_group, by_claim.values()))
 
 
     logger.info(f'Inserted {inserted} documents into silver_updates')
@@ -1,17 +1,29 @@
 # util/scrape_utils.py
 
 import os
+import re
 import sys
+import json
+import hashlib
+import xml.etree.ElementTree as ET
 import datetime
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+import atexit
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, TypeVar
 
 import requests
 import logging
 from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
 from email.utils import parsedate_to_datetime
-from rss_parser import RSSParser, AtomParser
+from urllib.parse import urljoin, urlsplit, urlunsplit
 try:
     from playwright.sync_api import sync_playwright
 except Exception:
@@ -21,30 +33,110 @@ _service_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if _service_dir not in sys.path:
     sys.path.insert(0, _service_dir)
 
-from models import LinkAggregationStep, LinkAggregationResult
-from functools import cache
+from models import ArticleLink, LinkAggregationStep, LinkAggregationResult
+from functools import cache, lru_cache
 
-def read_rss_feed(
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry_strategy)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared across scrapers so repeated requests to the same host reuse
+# keep-alive connections instead of paying a TCP+TLS handshake each time.
+SESSION = _build_session()
+
+_RSS_CACHE_DIR = os.path.join(_service_dir, ".cache", "rss")
+
+
+def _rss_cache_path(url: str) -> str:
+    return os.path.join(_RSS_CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def _load_rss_cache(url: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(_rss_cache_path(url), "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    for it in state.get("items", []):
+        if it.get("published"):
+            it["published"] = datetime.datetime.fromisoformat(it["published"])
+    return state
+
+
+def _save_rss_cache(url: str, etag: Optional[str], last_modified: Optional[str], items: List[Dict[str, Any]]) -> None:
+    state = {
+        "url": url,
+        "etag": etag,
+        "last_modified": last_modified,
+        "items": [
+            {**it, "published": it["published"].isoformat() if it.get("published") else None}
+            for it in items
+        ],
+    }
+    try:
+        os.makedirs(_RSS_CACHE_DIR, exist_ok=True)
+        tmp = _rss_cache_path(url) + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, _rss_cache_path(url))
+    except OSError as e:
+        logging.getLogger(__name__).warning("read_rss_feed: could not write cache for %s: %s", url, e)
+
+
+_SEEN_CACHE_DIR = os.path.join(_service_dir, ".cache", "seen")
+
+
+def load_seen_pages(name: str) -> Dict[str, str]:
+    """Load the persisted link -> extracted content map for a scraper (oldest first)."""
+    try:
+        with open(os.path.join(_SEEN_CACHE_DIR, name + ".json"), "r", encoding="utf-8") as f:
+            seen = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return seen if isinstance(seen, dict) else {}
+
+
+def save_seen_pages(name: str, seen: Dict[str, str], max_entries: int = 500) -> None:
+    """Persist the seen-page map, keeping only the ``max_entries`` most recently added links."""
+    if len(seen) > max_entries:
+        seen = dict(list(seen.items())[-max_entries:])
+    path = os.path.join(_SEEN_CACHE_DIR, name + ".json")
+    try:
+        os.makedirs(_SEEN_CACHE_DIR, exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(seen, f)
+        os.replace(path + ".tmp", path)
+    except OSError as e:
+        logging.getLogger(__name__).warning("save_seen_pages: could not write cache for %s: %s", name, e)
+
+
+def _open_feed(
     url: str,
-    timeout: int = 20,
-    headers: Optional[Dict[str, str]] = None,
-) -> List[Dict[str, Any]]:
+    timeout: int,
+    headers: Optional[Dict[str, str]],
+    validators: Optional[Dict[str, str]] = None,
+    stream: bool = False,
+) -> Optional[requests.Response]:
     """
-    Read an RSS/Atom feed and return a normalized list of items.
-
-    This is intentionally site-agnostic; scrapers can layer on date filtering,
-    tagging, and deduplication.
+    GET a feed, falling back through a few header profiles on timeouts/blocks.
 
-    Returned dict keys:
-      - title: str
-      - link: str
-      - published: Optional[datetime.datetime]
-      - summary: str
+    Returns the first successful (2xx or 304) response, or None when every
+    profile fails.
     """
-    # hdrs = {
-    #     "User-Agent": "Mozilla/5.0 (compatible; TheFollowUpBot/1.0)",
-    #     "Accept": "application/rss+xml, application/atom+xml, application/xml, text/xml;q=0.9, */*;q=0.8",
-    # }
     logger = logging.getLogger(__name__)
 
     # Default headers; user-agent helps some sites avoid slow responses or blocks
@@ -55,19 +147,6 @@ def read_rss_feed(
     if headers:
         hdrs.update(headers)
 
-    # Create a session with retries to handle transient network issues/timeouts.
-    session = requests.Session()
-    retry_strategy = Retry(
-        total=3,
-        backoff_factor=1,
-        status_forcelist=(429, 500, 502, 503, 504),
-        allowed_methods=("GET", "HEAD"),
-        raise_on_status=False,
-    )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
-
     # Try a few header profiles if the default request times out or is blocked.
     header_profiles = []
     # 1) default "bot" headers (above)
@@ -95,16 +174,27 @@ def read_rss_feed(
     last_exc = None
     for idx, prof in enumerate(header_profiles, start=1):
         try:
-            resp = session.get(url, headers=prof, timeout=(connect_timeout, read_timeout), allow_redirects=True)
+            resp = SESSION.get(
+                url,
+                headers={**prof, **(validators or {})},
+                timeout=(connect_timeout, read_timeout),
+                allow_redirects=True,
+                stream=stream,
+            )
             # Log quick diagnostics
             try:
                 elapsed = resp.elapsed.total_seconds()
             except Exception:
                 elapsed = None
             logger.info("read_rss_feed: attempt=%d url=%s status=%s elapsed=%s headers_profile=%s", idx, url, resp.status_code, elapsed, prof.get("User-Agent"))
-            resp.raise_for_status()
-            text = resp.text
-            break
+            try:
+                resp.raise_for_status()
+            except requests.exceptions.HTTPError:
+                # A streamed body is never read on this path; release the
+                # pooled connection before trying the next profile.
+                resp.close()
+                raise
+            return resp
         except requests.exceptions.ReadTimeout as e:
             logger.warning("read_rss_feed: read timeout on profile %d (%s): %s", idx, prof.get("User-Agent"), e)
             last_exc = e
@@ -114,121 +204,433 @@ def read_rss_feed(
             last_exc = e
             continue
 
-    else:
-        # All profiles exhausted
-        logger.warning("read_rss_feed: all header profiles failed for %s; last_exc=%s", url, last_exc)
+    # All profiles exhausted
+    logger.warning("read_rss_feed: all header profiles failed for %s; last_exc=%s", url, last_exc)
+    return None
+
+
+def read_rss_feed(
+    url: str,
+    timeout: int = 20,
+    headers: Optional[Dict[str, str]] = None,
+    conditional: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Read an RSS/Atom feed and return a normalized list of items.
+
+    This is intentionally site-agnostic; scrapers can layer on date filtering,
+    tagging, and deduplication.
+
+    With `conditional=True` the feed's ETag/Last-Modified and parsed items are
+    kept under service/.cache/rss. Later calls send If-None-Match /
+    If-Modified-Since and reuse the stored items on a 304 Not Modified.
+
+    Returned dict keys:
+      - title: str
+      - link: str
+      - published: Optional[datetime.datetime]
+      - summary: str
+    """
+    logger = logging.getLogger(__name__)
+
+    cached = _load_rss_cache(url) if conditional else None
+    validators: Dict[str, str] = {}
+    if cached:
+        if cached.get("etag"):
+            validators["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            validators["If-Modified-Since"] = cached["last_modified"]
+
+    resp = _open_feed(url, timeout, headers, validators=validators, stream=True)
+    if resp is None:
+        return []
+    try:
+        if resp.status_code == 304 and cached is not None:
+            logger.info("read_rss_feed: %s not modified; using %d cached items", url, len(cached.get("items", [])))
+            return cached.get("items", [])
+
+        # Parse straight off the socket (gzip undone by urllib3) rather than
+        # buffering the whole body in resp.content first.
+        resp.raw.decode_content = True
+        items = list(_iter_feed_items(resp.raw))
+    except ET.ParseError as e:
+        logger.warning("read_rss_feed: could not parse %s: %s", url, e)
+        return []
+    except (ProtocolError, ReadTimeoutError) as e:
+        logger.warning("read_rss_feed: body read failed for %s: %s", url, e)
         return []
+    finally:
+        resp.close()
+
+    if conditional:
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if etag or last_modified:
+            _save_rss_cache(url, etag, last_modified, items)
+    return items
 
-    def _unwrap_tag(val: Any) -> str:
-        # rss_parser Tag types or nested models may expose content, or be simple strings.
-        if val is None:
-            return ""
-        if isinstance(val, str):
-            return val
-        if hasattr(val, "content"):
-            try:
-                return val.content or ""
-            except Exception:
-                pass
-        if isinstance(val, dict):
-            return val.get("#text") or val.get("text") or ""
-        try:
-            return str(val)
-        except Exception:
-            return ""
 
-    def _to_datetime(raw: Any) -> Optional[datetime.datetime]:
-        if raw is None:
-            return None
-        if isinstance(raw, datetime.datetime):
-            return raw
-        try:
-            if isinstance(raw, str):
-                try:
-                    return datetime.datetime.fromisoformat(raw.replace("Z", "+00:00"))
-                except Exception:
-                    pass
-                try:
-                    return parsedate_to_datetime(raw)
-                except Exception:
-                    return None
-        except Exception:
-            return None
+def iter_rss_feed(
+    url: str,
+    timeout: int = 20,
+    headers: Optional[Dict[str, str]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming variant of read_rss_feed: yields items (same keys) as each
+    </item> / </entry> arrives off the wire.
+
+    Feeds are newest-first, so a caller that stops iterating once it is past
+    its target date never downloads or parses the rest of the document.
+    """
+    resp = _open_feed(url, timeout, headers, stream=True)
+    if resp is None:
+        return
+    try:
+        # Let urllib3 undo gzip/deflate so iterparse sees plain XML.
+        resp.raw.decode_content = True
+        yield from _iter_feed_items(resp.raw)
+    except ET.ParseError as e:
+        logging.getLogger(__name__).warning("iter_rss_feed: could not parse %s: %s", url, e)
+    finally:
+        resp.close()
+
+
+def _local_name(tag: str) -> str:
+    # "{http://www.w3.org/2005/Atom}entry" -> "entry"; "content:encoded" parses to "{...}encoded"
+    return tag.rpartition("}")[2]
+
+
+def _elem_text(el: Optional[ET.Element]) -> str:
+    if el is None:
+        return ""
+    return "".join(el.itertext()).strip()
 
-    items: List[Dict[str, Any]] = []
 
-    # Try RSSParser first
+def _parse_feed_date(raw: str) -> Optional[datetime.datetime]:
+    if not raw:
+        return None
     try:
-        rss = RSSParser.parse(text)
-        channel = getattr(rss, "channel", None)
-        rss_items = []
-        if channel is not None and getattr(channel, "items", None):
-            rss_items = list(channel.items)
-        if rss_items:
-            for it in rss_items:
-                title = _unwrap_tag(getattr(it, "title", None))
-                link = _unwrap_tag(getattr(it, "link", None))
-                # Some rss_parser models place link as a list or a Tag wrapper
-                if not link:
-                    guid = getattr(it, "guid", None)
-                    link = _unwrap_tag(guid)
-
-                pub_dt = _to_datetime(getattr(it, "pubDate", None) or getattr(it, "pubdate", None) or getattr(it, "dc_date", None) or getattr(it, "date", None))
-                if not pub_dt:
-                    try:
-                        pub_dt = _to_datetime(it.content.pub_date.content)
-                        # If has timezone, convert to local
-                        if pub_dt and pub_dt.tzinfo is not None:
-                            pub_dt = pub_dt.astimezone(datetime.timezone.utc).astimezone()
-                    except:
-                        continue
-                # description/content
-                summary = _unwrap_tag(getattr(it, "content", None) or getattr(it, "description", None) or getattr(it, "summary", None))
-
-                if title and link:
-                    items.append({"title": title, "link": link, "published": pub_dt, "summary": summary})
-            return items
-    except Exception:
-        # Fall back to Atom parsing below
+        # Atom / dc:date: ISO 8601
+        return datetime.datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
         pass
+    try:
+        # RSS pubDate: RFC 822
+        return parsedate_to_datetime(raw)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _feed_item(elem: ET.Element) -> Optional[Dict[str, Any]]:
+    """Normalize one RSS <item> or Atom <entry> into read_rss_feed's dict shape."""
+    fields: Dict[str, ET.Element] = {}
+    link = ""
+    for child in elem:
+        name = _local_name(child.tag)
+        if name == "link":
+            href = child.get("href")
+            if href is None:
+                # RSS: <link>url</link>
+                link = link or (child.text or "").strip()
+            elif child.get("rel", "alternate") == "alternate" or not link:
+                # Atom: prefer rel="alternate" (the default), else the first href
+                link = href.strip()
+        elif name not in fields:
+            fields[name] = child
+
+    def _first(*names: str) -> Optional[ET.Element]:
+        for n in names:
+            if n in fields:
+                return fields[n]
+        return None
+
+    title = _elem_text(fields.get("title"))
+    if not link:
+        link = _elem_text(fields.get("guid")) or _elem_text(fields.get("id"))
+    if not title or not link:
+        return None
+
+    return {
+        "title": title,
+        "link": link,
+        "published": _parse_feed_date(_elem_text(_first("pubDate", "published", "updated", "date"))),
+        # Prefer full bodies (content:encoded / Atom content) over short descriptions
+        "summary": _elem_text(_first("encoded", "content", "description", "summary")),
+    }
+
+
+def _iter_feed_items(source: Any) -> Iterator[Dict[str, Any]]:
+    """Incrementally parse an RSS or Atom document from a file-like `source`.
+
+    Each <item>/<entry> is converted and cleared as soon as its end tag is
+    seen, so the full DOM is never held in memory.
+    """
+    for _, elem in ET.iterparse(source, events=("end",)):
+        if _local_name(elem.tag) not in ("item", "entry"):
+            continue
+        item = _feed_item(elem)
+        elem.clear()
+        if item is not None:
+            yield item
 
-    # Try Atom
+
+_MONTH_NAMES = (
+    "january", "february", "march", "april", "may", "june", "july",
+    "august", "september", "october", "november", "december",
+)
+# Full names and three-letter abbreviations ("%B" and "%b"), lowercased.
+MONTHS = {
+    **{name: i for i, name in enumerate(_MONTH_NAMES, start=1)},
+    **{name[:3]: i for i, name in enumerate(_MONTH_NAMES, start=1)},
+}
+_LONG_DATE_RE = re.compile(r"([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4})")
+
+
+def date_from_parts(month: str, day: str, year: str) -> Optional[datetime.date]:
+    """Build a date from ("December", "17", "2025")-style parts, or None if invalid.
+
+    A dict lookup on the month name; much cheaper than strptime("%B %d, %Y")
+    in per-item listing loops.
+    """
+    m = MONTHS.get(month.lower())
+    if m is None:
+        return None
     try:
-        atom = AtomParser.parse(text)
-        entries = getattr(atom, "entries", None) or getattr(atom, "feed", None) and getattr(atom.feed, "entries", None) or []
-        if entries:
-            for ent in entries:
-                title = _unwrap_tag(getattr(ent, "title", None))
-
-                # Atom links may be list-like or models with href
-                link_val = getattr(ent, "link", None)
-                link = ""
-                if link_val:
-                    if isinstance(link_val, str):
-                        link = link_val
-                    elif isinstance(link_val, (list, tuple)):
-                        # prefer alternate rel or first available
-                        chosen = None
-                        for l in link_val:
-                            if getattr(l, "rel", None) == "alternate" or (hasattr(l, "rel") and (getattr(l, "rel") or "").lower() == "alternate"):
-                                chosen = l
-                                break
-                        chosen = chosen or link_val[0]
-                        link = _unwrap_tag(getattr(chosen, "href", None) or chosen)
-                    else:
-                        link = _unwrap_tag(getattr(link_val, "href", None) or link_val)
-
-                pub_dt = _to_datetime(getattr(ent, "published", None) or getattr(ent, "updated", None))
-                summary = _unwrap_tag(getattr(ent, "content", None) or getattr(ent, "summary", None) or getattr(ent, "description", None))
-
-                if title and link:
-                    items.append({"title": title, "link": link, "published": pub_dt, "summary": summary})
-            return items
-    except Exception:
-        pass
+        return datetime.date(int(year), m, int(day))
+    except ValueError:
+        return None
 
-    # As a last resort, return an empty list
-    return items
+
+@lru_cache(maxsize=1024)
+def parse_long_date(text: str) -> Optional[datetime.date]:
+    """Parse a string that is exactly "Month D, YYYY" or "Mon D, YYYY" (whitespace-tolerant).
+
+    Cached: listing pages repeat the same handful of date strings on every row.
+    """
+    m = _LONG_DATE_RE.fullmatch((text or "").strip())
+    if not m:
+        return None
+    return date_from_parts(*m.groups())
+
+
+def get_until(
+    url: str,
+    marker: bytes,
+    timeout: int = 30,
+    headers: Optional[Dict[str, str]] = None,
+    chunk_size: int = 16384,
+) -> Tuple[bytes, bool]:
+    """Stream `url` and stop reading once `marker` (e.g. b"</main>") has arrived.
+
+    Returns (body, found): the bytes read up to and including `marker`, or the
+    whole body when the marker never appears. Saves downloading and parsing
+    long footers/related-content blocks that come after the part we keep.
+    """
+    resp = SESSION.get(url, headers=headers, timeout=timeout, allow_redirects=True, stream=True)
+    try:
+        resp.raise_for_status()
+        buf = bytearray()
+        for chunk in resp.iter_content(chunk_size=chunk_size):
+            # Only rescan the tail that could contain a marker split across chunks
+            start = max(0, len(buf) - len(marker))
+            buf += chunk
+            idx = buf.find(marker, start)
+            if idx != -1:
+                del buf[idx + len(marker):]
+                return bytes(buf), True
+        return bytes(buf), False
+    finally:
+        resp.close()
+
+
+BOILERPLATE_TAGS = ("script", "style", "noscript", "nav", "header", "footer", "aside", "form")
+
+
+MAIN_ROOTS = (".//main", ".//article")
+
+# lxml parsers must not be shared between threads, and pages are parsed from
+# the map_concurrent workers; keep one parser per thread.
+_HTML_PARSERS = threading.local()
+
+
+def parse_html(content: bytes) -> lxml.html.HtmlElement:
+    """Parse page bytes into an lxml document, decoding as UTF-8.
+
+    Parses the bytes directly rather than a decoded str: lxml rejects str input
+    that carries an <?xml ... encoding=...?> declaration (XHTML pages). The
+    explicit encoding also stops lxml guessing latin-1 for pages without a
+    charset <meta>. Raises etree.ParserError for an empty document.
+    """
+    parser = getattr(_HTML_PARSERS, "parser", None)
+    if parser is None:
+        parser = _HTML_PARSERS.parser = lxml.html.HTMLParser(encoding="utf-8")
+    return lxml.html.document_fromstring(content, parser=parser)
+
+
+def main_content_html(
+    content: bytes,
+    strip_tags: Tuple[str, ...] = BOILERPLATE_TAGS,
+    roots: Tuple[str, ...] = MAIN_ROOTS,
+) -> str:
+    """Return the HTML of the page's main content region with `strip_tags` removed.
+
+    The region is the first match among `roots` (ElementPath expressions,
+    <main> then <article> by default), else <body>. One lxml parse and a
+    single C-level strip_elements() walk, instead of BeautifulSoup
+    find_all()/decompose() loops per tag name. Returns "" when the document
+    is empty or unparseable.
+    """
+    if not content:
+        return ""
+    try:
+        root = parse_html(content)
+    except etree.ParserError:
+        return ""
+
+    node = None
+    for path in (*roots, "body"):
+        node = root.find(path)
+        if node is not None:
+            break
+    if node is None:
+        node = root
+
+    etree.strip_elements(node, *strip_tags, with_tail=False)
+    return lxml.html.tostring(node, encoding="unicode")
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; TheFollowUpBot/1.0)",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+
+def fetch(
+    url: str,
+    *,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 30,
+    use_playwright: bool = False,
+    try_requests: Literal['first', 'last', 'dont', 'default'] = 'default',
+) -> bytes:
+    """GET `url` and return the body bytes, raising on HTTP errors.
+
+    Plain requests over the shared SESSION unless `use_playwright` is set, in
+    which case playwright_get() renders the page; `try_requests` is passed
+    through to it (use 'dont' to always open a browser). `headers` defaults
+    to DEFAULT_HEADERS; pass {} to send none.
+    """
+    hdrs = DEFAULT_HEADERS if headers is None else headers
+    if use_playwright:
+        resp = playwright_get(url, timeout=timeout, headers=hdrs, try_requests=try_requests)
+    else:
+        resp = SESSION.get(url, headers=hdrs, timeout=timeout, allow_redirects=True)
+    resp.raise_for_status()
+    return resp.content
+
+
+def fetch_soup(
+    url: str,
+    *,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 30,
+    use_playwright: bool = False,
+    try_requests: Literal['first', 'last', 'dont', 'default'] = 'default',
+    strainer: Optional[SoupStrainer] = None,
+) -> BeautifulSoup:
+    """fetch() and parse with the lxml tree builder, optionally only the `strainer` subtree."""
+    content = fetch(url, headers=headers, timeout=timeout, use_playwright=use_playwright, try_requests=try_requests)
+    return BeautifulSoup(content, "lxml", parse_only=strainer)
+
+
+def extract_main(
+    url: str,
+    *,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 30,
+    use_playwright: bool = False,
+    strip_tags: Tuple[str, ...] = BOILERPLATE_TAGS,
+    roots: Tuple[str, ...] = MAIN_ROOTS,
+) -> str:
+    """fetch() an article page and return its main content HTML (see main_content_html)."""
+    content = fetch(url, headers=headers, timeout=timeout, use_playwright=use_playwright)
+    return main_content_html(content, strip_tags=strip_tags, roots=roots)
+
+
+def fast_urljoin(base: str, href: str) -> str:
+    """urljoin() for the common listing-page cases without parsing either URL.
+
+    `base` must be a bare origin such as "https://www.dhs.gov" (no path, no
+    trailing slash). Root-relative and absolute hrefs are handled by string
+    ops; anything else (protocol-relative, "../x", "?page=2") goes through
+    urljoin as before.
+    """
+    if href.startswith("/") and not href.startswith("//"):
+        return base + href
+    if href.startswith(("https://", "http://")):
+        return href
+    return urljoin(base, href)
+
+
+def canonical_url(url: str) -> str:
+    """Dedup key for a link: lowercase scheme/host, no fragment, no trailing
+    slash on the path, query parameters sorted. Not meant for fetching."""
+    u = urlsplit(url.strip())
+    query = "&".join(sorted(u.query.split("&"))) if u.query else ""
+    return urlunsplit((u.scheme.lower(), u.netloc.lower(), u.path.rstrip("/") or "/", query, ""))
+
+
+def map_concurrent(fn: Callable[[_T], _R], items: Iterable[_T], max_workers: int = 8) -> List[_R]:
+    """Apply `fn` to each item on a thread pool; results come back in input order.
+
+    Meant for the per-article fetches in listing scrapers: N article pages
+    cost roughly one round trip instead of N. The first exception raised by
+    `fn` propagates, as it would from a plain loop.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(x) for x in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(fn, items))
+
+
+def trusted_article_link(
+    *,
+    title: str,
+    link: str,
+    date: datetime.date,
+    tags: List[str],
+    raw_content: str,
+    process_posturing: bool = False,
+) -> ArticleLink:
+    """Build an ArticleLink with model_construct, skipping pydantic validation.
+
+    Only for fields the caller has already normalized: a non-empty title, an
+    absolute article URL, a datetime.date (not a datetime or string), and str
+    tags/raw_content. Anything looser goes through ArticleLink(...) so the
+    model's validators can coerce it.
+    """
+    return ArticleLink.model_construct(
+        title=title,
+        link=link,
+        date=date,
+        tags=tags,
+        raw_content=raw_content,
+        process_posturing=process_posturing,
+    )
+
+
+def fill_raw_content(articles: List[ArticleLink], fn: Callable[[str], str], max_workers: int = 8) -> None:
+    """Set each article's raw_content to `fn(article.link)`, fetched via map_concurrent.
+
+    Article bodies are independent fetches, so listing scrapers collect their
+    ArticleLinks with raw_content="" and fill them all in one concurrent pass.
+    `fn` is usually an lru_cache'd extractor, since the same article can show
+    up more than once in a run; scrape() clears that cache on entry so the
+    memo only lives for one run.
+    """
+    for article, body in zip(articles, map_concurrent(fn, [a.link for a in articles], max_workers=max_workers)):
+        article.raw_content = body
 
 
 def iter_scrape(
@@ -249,13 +651,147 @@ def iter_scrape(
         i += 1
     return LinkAggregationResult.from_steps(results)
 
-@cache
+
+def iter_scrape_prefetch(
+    url_template: str,
+    start_page: int,
+    date: datetime.date,
+    fetch_fn: Callable[[str], _T],
+    parse_fn: Callable[[_T, str, datetime.date], LinkAggregationStep],
+    prefetch: int = 3,
+) -> LinkAggregationResult:
+    """iter_scrape with the page fetch split from the parse.
+
+    The next `prefetch` listing pages are fetched on a thread pool while the
+    current one is parsed, so a run spanning several pages costs roughly one
+    page of latency. Same stopping rule as iter_scrape; at most `prefetch`
+    pages past the last one are fetched and discarded.
+    """
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, prefetch)) as pool:
+        pending = deque()
+        next_page = start_page
+
+        def _submit() -> None:
+            nonlocal next_page
+            url = url_template.replace("{{PAGE}}", str(next_page))
+            pending.append((url, pool.submit(fetch_fn, url)))
+            next_page += 1
+
+        for _ in range(max(1, prefetch)):
+            _submit()
+
+        while pending:
+            url, fut = pending.popleft()
+            result = parse_fn(fut.result(), url, date)
+            results.append(result)
+            if not result.look_further or len(result.articles) == 0:
+                break
+            _submit()
+
+        for _, fut in pending:
+            fut.cancel()
+    return LinkAggregationResult.from_steps(results)
+
+
+class _BrowserWorker:
+    """One long-lived headless Chromium, driven from a single daemon thread.
+
+    Playwright's sync API is bound to the thread that started it, while
+    scrapers call playwright_get() from thread pools, so every render is
+    handed to this thread. The browser is launched on first use and reused
+    for each page after that instead of paying Chromium startup per URL.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: "queue.Queue[Tuple[Future, Optional[str], Dict[str, str], int]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._atexit_registered = False
+        # Only touched from the worker thread
+        self._pw = None
+        self._browser = None
+
+    def render(self, url: str, headers: Dict[str, str], timeout_ms: int = 20000) -> str:
+        """Load `url` in a fresh page of the shared browser and return its HTML."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="playwright-browser", daemon=True)
+                self._thread.start()
+                if not self._atexit_registered:
+                    atexit.register(self.close)
+                    self._atexit_registered = True
+        fut: Future = Future()
+        self._jobs.put((fut, url, headers, timeout_ms))
+        return fut.result()
+
+    def close(self) -> None:
+        """Close the browser and stop the worker thread (no-op if never started)."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                return
+            fut: Future = Future()
+            self._jobs.put((fut, None, {}, 0))
+        try:
+            fut.result(timeout=10)
+        except Exception:
+            pass
+
+    def _run(self) -> None:
+        while True:
+            fut, url, headers, timeout_ms = self._jobs.get()
+            if url is None:
+                self._shutdown()
+                fut.set_result(None)
+                return
+            try:
+                fut.set_result(self._render(url, headers, timeout_ms))
+            except Exception as e:
+                fut.set_exception(e)
+
+    def _render(self, url: str, headers: Dict[str, str], timeout_ms: int) -> str:
+        if self._browser is None or not self._browser.is_connected():
+            if self._pw is None:
+                self._pw = sync_playwright().start()
+            self._browser = self._pw.chromium.launch(headless=True)
+        page = self._browser.new_page()
+        try:
+            page.set_extra_http_headers({k.lower(): v for k, v in headers.items()})
+            page.goto(url, wait_until="networkidle", timeout=timeout_ms)
+            return page.content()
+        finally:
+            page.close()
+
+    def _shutdown(self) -> None:
+        for closer in (getattr(self._browser, "close", None), getattr(self._pw, "stop", None)):
+            if closer is None:
+                continue
+            try:
+                closer()
+            except Exception:
+                pass
+        self._browser = None
+        self._pw = None
+
+
+_BROWSER = _BrowserWorker()
+
+
 def playwright_get(url: str, timeout: int = 20, headers: Optional[Dict[str, str]] = None, try_requests: Literal['first', 'last', 'dont', 'default'] = 'default'):
     """Try a few requests header profiles, then fall back to Playwright to render JS.
 
     Returns an object with `.content` (bytes), `.status_code` and `.raise_for_status()`.
+    Results are cached per (url, timeout, headers, try_requests).
     """
+    # dicts aren't hashable; key the cache on a frozen copy of the headers
+    headers_key = tuple(sorted(headers.items())) if headers else None
+    return _playwright_get_cached(url, timeout, headers_key, try_requests)
+
+
+@cache
+def _playwright_get_cached(url: str, timeout: int, headers_key: Optional[Tuple[Tuple[str, str], ...]], try_requests: str):
     logger = logging.getLogger(__name__)
+    headers = dict(headers_key) if headers_key else None
 
     hdrs = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -278,11 +814,8 @@ def playwright_get(url: str, timeout: int = 20, headers: Optional[Dict[str, str]
     
     # Define request logic
     def _try_requests():
-        session = requests.Session()
-        retry_strategy = Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=("GET",), raise_on_status=False)
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
+        # Shared pooled session: no fresh TCP+TLS handshake per call.
+        session = SESSION
         profiles = [{}, hdrs, {"User-Agent": "PostmanRuntime/7.32.4"}, {"User-Agent": hdrs["User-Agent"], "Accept-Language": "en-US,en;q=0.9"}]
         last_exc = None
         for prof in profiles:
@@ -302,13 +835,7 @@ def playwright_get(url: str, timeout: int = 20, headers: Optional[Dict[str, str]
     def _do_playwright():
         if sync_playwright is None:
             raise RuntimeError("playwright_get: Playwright is not installed; install with `pip install playwright` and run `python -m playwright install chromium`")
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.set_extra_http_headers({k.lower(): v for k, v in hdrs.items()})
-            page.goto(url, wait_until="networkidle", timeout=20000)
-            html = page.content()
-            browser.close()
+        html = _BROWSER.render(url, hdrs)
         class _Resp:
             def __init__(self, text: str):
                 self.content = text.encode("utf-8")